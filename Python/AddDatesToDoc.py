@@ -1,34 +1,56 @@
 import pandas as pd
 from docx import Document
-import openpyxl
+import logging
 import os
 import re
 from datetime import datetime
-from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from lxml import etree
 from copy import deepcopy
 
+from NewArticles import (
+    build_cache_path,
+    create_excel_file,
+    extract_articles_from_document,
+    process_articles_for_dates,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except Exception:
+    EXCEL_ENGINE = "openpyxl"
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+QUOTE_PATTERN = re.compile(r'[""' '""' "]")
+DASH_PATTERN = re.compile(r"[–—]")
+
+# Keywords that mark a paragraph as an article (plain substring match)
+ARTICLE_KEYWORD_PATTERN = re.compile(
+    r"microsoft|ai|anthropic|openai|chatgpt", re.IGNORECASE
+)
+
+# Word XML tags used when reading paragraphs directly
+W_P = qn("w:p")
+W_PPR = qn("w:pPr")
+W_R = qn("w:r")
+W_T = qn("w:t")
+XML_SPACE = qn("xml:space")
+
 
 def read_dates_from_excel(excel_path):
     """Read the publication dates from the Excel file"""
     print(f"Reading dates from: {excel_path}")
 
-    # Read the Excel file
-    wb = openpyxl.load_workbook(excel_path)
-    ws = wb.active
+    # Read column A (Title) and column B (Publication Date), skipping the header row
+    df = pd.read_excel(excel_path, engine=EXCEL_ENGINE, usecols=[0, 1], dtype=str)
+    df = df.dropna()
 
     # Create a dictionary to map titles to dates
-    title_to_date = {}
-
-    # Skip header row and read data
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        title = row[0]  # Column A: Title
-        pub_date = row[1]  # Column B: Publication Date
-
-        if title and pub_date:
-            # Clean the title for matching
-            clean_title = title.strip()
-            title_to_date[clean_title] = str(pub_date)
+    title_to_date = dict(zip(df.iloc[:, 0].str.strip(), df.iloc[:, 1]))
 
     print(f"Found dates for {len(title_to_date)} articles")
     return title_to_date
@@ -41,49 +63,48 @@ def update_word_document_with_dates(docx_path, title_to_date, output_path):
     # Open the original document
     doc = Document(docx_path)
 
+    # Index the Excel titles once instead of comparing every pair
+    title_index = build_title_index(title_to_date)
+
     # Track statistics
     updated_count = 0
     not_found_count = 0
 
-    print(f"Processing {len(doc.paragraphs)} paragraphs...")
+    # Read the paragraph XML directly rather than through python-docx objects
+    paragraphs = list(doc.element.body.iterchildren(W_P))
+
+    print(f"Processing {len(paragraphs)} paragraphs...")
 
-    for i, paragraph in enumerate(doc.paragraphs):
-        text = paragraph.text.strip()
+    for i, p_elem in enumerate(paragraphs):
+        text = paragraph_text(p_elem).strip()
 
         if not text:
             continue
 
         # Check if this looks like an article entry
-        if text.startswith("-") or any(
-            keyword in text.lower()
-            for keyword in ["microsoft", "ai", "anthropic", "openai", "chatgpt"]
-        ):
+        if text.startswith("-") or ARTICLE_KEYWORD_PATTERN.search(text):
             # Clean up the title to match against our Excel data
             original_title = text.lstrip("- ").strip()
 
             # Look for a matching date
-            matching_date = None
-            for excel_title, date in title_to_date.items():
-                if titles_match(original_title, excel_title):
-                    matching_date = date
-                    break
+            matching_date = find_matching_date(original_title, title_index)
 
             if matching_date:
                 try:
                     success = prepend_date_preserve_hyperlinks(
-                        paragraph, matching_date, text.startswith("-")
+                        p_elem, matching_date, text.startswith("-")
                     )
                     if success:
                         updated_count += 1
-                        print(f"Updated: {original_title[:50]}... -> {matching_date}")
+                        logger.debug(f"Updated: {original_title[:50]}... -> {matching_date}")
                     else:
-                        print(f"Failed to update: {original_title[:50]}...")
+                        logger.warning(f"Failed to update: {original_title[:50]}...")
                 except Exception as e:
-                    print(f"Error updating paragraph {i+1}: {e}")
-                    print(f"  Text: {text[:50]}...")
+                    logger.warning(f"Error updating paragraph {i+1}: {e}")
+                    logger.warning(f"  Text: {text[:50]}...")
             else:
                 not_found_count += 1
-                print(f"No date found for: {original_title[:50]}...")
+                logger.debug(f"No date found for: {original_title[:50]}...")
 
     # Save the updated document
     print(f"Saving updated document to: {output_path}")
@@ -97,7 +118,12 @@ def update_word_document_with_dates(docx_path, title_to_date, output_path):
     return updated_count, not_found_count
 
 
-def prepend_date_preserve_hyperlinks(paragraph, date, has_dash):
+def paragraph_text(p_elem):
+    """Join the text nodes of a <w:p> element"""
+    return "".join(t.text or "" for t in p_elem.iter(W_T))
+
+
+def prepend_date_preserve_hyperlinks(p_elem, date, has_dash):
     """Prepend date while preserving hyperlinks by working with XML directly"""
     try:
         # Create the date prefix
@@ -106,23 +132,19 @@ def prepend_date_preserve_hyperlinks(paragraph, date, has_dash):
         else:
             date_prefix = f"{date} - "
 
-        # Get the paragraph XML element
-        p_elem = paragraph._element
+        # The prefix carries its own dash, so drop the original one first
+        if has_dash:
+            remove_leading_dash_from_paragraph(p_elem)
 
         # Create a new run element for the date
-        new_run = OxmlElement("w:r")
-
-        # Create text element
-        new_text = OxmlElement("w:t")
+        new_run = p_elem.makeelement(W_R)
+        new_text = etree.SubElement(new_run, W_T)
+        new_text.set(XML_SPACE, "preserve")
         new_text.text = date_prefix
-        new_run.append(new_text)
 
-        # Insert at the beginning of the paragraph
-        p_elem.insert(0, new_run)
-
-        # If the original started with "- ", we need to remove it from the existing content
-        if has_dash:
-            remove_leading_dash_from_paragraph(p_elem)
+        # Insert at the beginning of the paragraph, after its properties
+        index = 1 if len(p_elem) and p_elem[0].tag == W_PPR else 0
+        p_elem.insert(index, new_run)
 
         return True
 
@@ -135,8 +157,8 @@ def remove_leading_dash_from_paragraph(p_elem):
     """Remove the leading '- ' from the paragraph content"""
     try:
         # Find the first text node and remove "- " from it
-        for elem in p_elem.iter():
-            if elem.tag.endswith("}t") and elem.text:  # This is a text element
+        for elem in p_elem.iterdescendants(W_T):
+            if elem.text:
                 if elem.text.startswith("- "):
                     elem.text = elem.text[2:]  # Remove "- "
                     break
@@ -147,12 +169,67 @@ def remove_leading_dash_from_paragraph(p_elem):
         print(f"Error removing leading dash: {e}")
 
 
+def build_title_index(title_to_date):
+    """Index Excel titles by cleaned text and by 50-character prefix"""
+    exact_map = {}
+    prefix_map = {}
+    long_titles = []
+
+    for title, date in title_to_date.items():
+        clean_title = clean_title_for_matching(title)
+        exact_map.setdefault(clean_title, date)
+        prefix_map.setdefault(clean_title[:50], date)
+
+        # Only long titles take part in the containment check
+        if len(clean_title) > 20:
+            long_titles.append((clean_title, date, title_fingerprint(clean_title)))
+
+    return exact_map, prefix_map, long_titles
+
+
+def title_fingerprint(title):
+    """Bit set of the title's 4-character shingles, folded into 256 bits"""
+    fingerprint = 0
+    for i in range(len(title) - 3):
+        fingerprint |= 1 << (hash(title[i : i + 4]) & 255)
+    return fingerprint
+
+
+def find_matching_date(title, title_index):
+    """Look up the date for a document title using the same rules as titles_match"""
+    exact_map, prefix_map, long_titles = title_index
+    clean_title = clean_title_for_matching(title)
+
+    # Exact match, then first 50 characters
+    date = exact_map.get(clean_title) or prefix_map.get(clean_title[:50])
+    if date:
+        return date
+
+    # Check if one is contained in the other (for cases where title might be truncated)
+    if len(clean_title) > 20:
+        fingerprint = title_fingerprint(clean_title)
+        for excel_title, date, excel_fingerprint in long_titles:
+            # A contained title's shingles are all present in the longer one,
+            # so skip the substring search unless one bit set covers the other
+            common = fingerprint & excel_fingerprint
+            if common != fingerprint and common != excel_fingerprint:
+                continue
+
+            if titles_match_cleaned(clean_title, excel_title):
+                return date
+
+    return None
+
+
 def titles_match(title1, title2):
     """Check if two titles are similar enough to be considered a match"""
-    # Clean both titles
-    clean1 = clean_title_for_matching(title1)
-    clean2 = clean_title_for_matching(title2)
+    return titles_match_cleaned(
+        clean_title_for_matching(title1), clean_title_for_matching(title2)
+    )
+
 
+def titles_match_cleaned(clean1, clean2):
+    """titles_match for titles already passed through clean_title_for_matching"""
     # Exact match
     if clean1 == clean2:
         return True
@@ -175,15 +252,63 @@ def clean_title_for_matching(title):
     title = title.lower()
 
     # Remove extra whitespace
-    title = re.sub(r"\s+", " ", title).strip()
+    title = WHITESPACE_PATTERN.sub(" ", title).strip()
 
     # Remove common punctuation that might differ
-    title = re.sub(r'[""' '""' "]", '"', title)  # Normalize quotes
-    title = re.sub(r"[–—]", "-", title)  # Normalize dashes
+    title = QUOTE_PATTERN.sub('"', title)  # Normalize quotes
+    title = DASH_PATTERN.sub("-", title)  # Normalize dashes
 
     return title
 
 
+def run_pipeline(docx_path, output_docx, output_xlsx, delay=2, cache_path=None):
+    """Fetch dates for a new-articles document and write both the Excel file and the dated document"""
+    print(f"Reading original document: {docx_path}")
+
+    # Parse the document once and keep it open for the date-prepend pass
+    doc = Document(docx_path)
+    articles = extract_articles_from_document(doc)
+
+    if not articles:
+        print("No articles found in the document!")
+        return 0, 0
+
+    # Fetch every URL once, reusing dates from earlier runs
+    process_articles_for_dates(
+        articles, delay=delay, cache_path=cache_path or build_cache_path(output_xlsx)
+    )
+
+    # Write the Excel file straight from the in-memory results
+    create_excel_file(articles, output_xlsx)
+
+    # Prepend dates to the same paragraphs that were read above
+    updated_count = 0
+    not_found_count = 0
+
+    for article in articles:
+        date = article["publication_date"]
+        if not date:
+            not_found_count += 1
+            continue
+
+        p_elem = article["paragraph"]
+        has_dash = paragraph_text(p_elem).strip().startswith("-")
+        if prepend_date_preserve_hyperlinks(p_elem, date, has_dash):
+            updated_count += 1
+
+    # Save the updated document
+    print(f"Saving updated document to: {output_docx}")
+    doc.save(output_docx)
+
+    print(f"\n=== PIPELINE SUMMARY ===")
+    print(f"Articles updated with dates: {updated_count}")
+    print(f"Articles without dates: {not_found_count}")
+    print(f"Excel file saved to: {os.path.abspath(output_xlsx)}")
+    print(f"Updated document saved to: {os.path.abspath(output_docx)}")
+
+    return updated_count, not_found_count
+
+
 def main():
     """Main function to update Word document with dates"""
     # File paths
@@ -1,6 +1,8 @@
 import pandas as pd
 from docx import Document
+from docx.oxml.ns import qn
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
 from datetime import datetime
@@ -11,45 +13,180 @@ from urllib.parse import urljoin, urlparse
 import logging
 import os
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+try:
+    import orjson
+
+    def json_loads(text):
+        """Decode with orjson, retrying with json for input only it accepts (NaN, lone surrogates)"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+except Exception:
+    json_loads = json.loads
+
+try:
+    from lxml import etree
+
+    HTML_PARSER = "lxml"
+except Exception:
+    etree = None
+    HTML_PARSER = "html.parser"
 
 # Set up logging
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
 )
 logger = logging.getLogger(__name__)
 
 
+def build_http_session():
+    """Shared session so connections are kept alive and reused per host"""
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
+# Extracted dates are reused for a week; errors are always refetched
+DATE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+CACHEABLE_STATUSES = frozenset({"success", "no_date_found"})
+
+# Keywords that mark a paragraph as an article (plain substring match)
+ARTICLE_KEYWORD_PATTERN = re.compile(
+    r"microsoft|ai|anthropic|openai|chatgpt", re.IGNORECASE
+)
+
+# Common date patterns in page text, in priority order
+TEXT_DATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
+        r"Publication Date:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
+        r"(\d{1,2}/\d{1,2}/\d{4})",
+        r"(\d{4}-\d{2}-\d{2})",
+        r"([A-Za-z]+ \d{1,2},? \d{4})",
+    ]
+)
+# Each pattern accepts every string its formats can parse, so a string
+# is only handed to strptime with formats that can actually match it
+DATE_FORMAT_DISPATCH = tuple(
+    (re.compile(pattern, re.IGNORECASE), formats)
+    for pattern, formats in [
+        (r"\d{4}-\d{1,2}- ?\d{1,2}", ("%Y-%m-%d",)),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}",
+            ("%Y-%m-%dT%H:%M:%S",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}Z",
+            ("%Y-%m-%dT%H:%M:%SZ",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}\.\d{1,6}Z",
+            ("%Y-%m-%dT%H:%M:%S.%fZ",),
+        ),
+        (r"[a-z]+\s+ ?\d{1,2},\s*\d{4}", ("%B %d, %Y", "%b %d, %Y")),
+        (r" ?\d{1,2}/ ?\d{1,2}/\d{4}", ("%m/%d/%Y", "%d/%m/%Y")),
+        (r"\d{4}/\d{1,2}/ ?\d{1,2}", ("%Y/%m/%d",)),
+        (r"[a-z]+\s+ ?\d{1,2}\s+\d{4}", ("%B %d %Y", "%b %d %Y")),
+        (r" ?\d{1,2}\s+[a-z]+\s+\d{4}", ("%d %B %Y", "%d %b %Y")),
+    ]
+)
+ISO_DAY_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Lowercased property/name/itemprop values of <meta> tags that hold a date
+META_DATE_KEY_PRIORITY = (
+    "article:published_time",
+    "article:published",
+    "publish-date",
+    "publication-date",
+    "date",
+    "dc.date",
+    "og:published_time",
+    "publishdate",
+    "pub_date",
+    "datepublished",
+)
+META_DATE_KEYS = frozenset(META_DATE_KEY_PRIORITY)
+
+# Bytes read per chunk when streaming article pages
+STREAM_CHUNK_SIZE = 65536
+
+# Specific date classes, combined so the page is only walked once
+ARTICLE_DATE_SELECTOR = ", ".join(
+    [
+        ".published-date",
+        ".publish-date",
+        ".publication-date",
+        ".date-published",
+        ".article-date",
+        ".post-date",
+        ".entry-date",
+        ".timestamp",
+    ]
+)
+
+# Class substrings checked only when no specific date class matched
+WILDCARD_DATE_CLASSES = ("date", "publish")
+
+# Publication dates sit near the top of a page, so only scan this much text
+TEXT_PATTERN_SCAN_LIMIT = 200_000
+ISO_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Word XML tags used when reading paragraphs directly
+W_P = qn("w:p")
+W_T = qn("w:t")
+W_HYPERLINK = qn("w:hyperlink")
+R_ID = qn("r:id")
+
+
 def extract_articles_and_links(docx_path):
     """Extract article titles and hyperlinks from Word document"""
-    doc = Document(docx_path)
+    logger.info(f"Reading document: {docx_path}")
+    return extract_articles_from_document(Document(docx_path))
+
+
+def extract_articles_from_document(doc):
+    """Extract article titles, hyperlinks and paragraph elements from an open Document"""
+    rels = doc.part.rels
     articles = []
 
-    logger.info(f"Reading document: {docx_path}")
-    logger.info(f"Total paragraphs in document: {len(doc.paragraphs)}")
+    # Read the paragraph XML directly rather than through python-docx objects
+    paragraphs = list(doc.element.body.iterchildren(W_P))
+
+    logger.info(f"Total paragraphs in document: {len(paragraphs)}")
 
-    for i, paragraph in enumerate(doc.paragraphs):
-        text = paragraph.text.strip()
+    for i, p_elem in enumerate(paragraphs):
+        text = paragraph_text(p_elem).strip()
 
         if not text:
             continue
 
         # More flexible matching - same as debug version
-        if text.startswith("-") or any(
-            title_word in text.lower()
-            for title_word in ["microsoft", "ai", "anthropic", "openai", "chatgpt"]
-        ):
+        if text.startswith("-") or ARTICLE_KEYWORD_PATTERN.search(text):
             # Clean up title (remove leading dash and extra spaces)
             title = text.lstrip("- ").strip()
 
-            # Try multiple methods to extract hyperlink
-            hyperlink_url = (
-                extract_hyperlink_method1(paragraph)
-                or extract_hyperlink_method2(paragraph)
-                or extract_hyperlink_method3(paragraph)
-            )
+            hyperlink_url = extract_hyperlink(p_elem, rels)
 
-            print(f"Found article {len(articles)+1}: {title[:60]}...")
-            print(f"  URL: {hyperlink_url}")
+            logger.debug(f"Found article {len(articles)+1}: {title[:60]}...")
+            logger.debug(f"  URL: {hyperlink_url}")
 
             articles.append(
                 {
@@ -57,6 +194,7 @@ def extract_articles_and_links(docx_path):
                     "url": hyperlink_url,
                     "publication_date": None,
                     "status": "pending" if hyperlink_url else "no_url",
+                    "paragraph": p_elem,
                 }
             )
 
@@ -64,94 +202,107 @@ def extract_articles_and_links(docx_path):
     return articles
 
 
-def extract_hyperlink_method1(paragraph):
-    """Method 1: Standard hyperlink extraction"""
-    try:
-        for elem in paragraph._element.iter():
-            if "hyperlink" in str(elem.tag).lower():
-                r_id = elem.get(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
-                )
-                if (
-                    r_id
-                    and hasattr(paragraph.part, "rels")
-                    and r_id in paragraph.part.rels
-                ):
-                    url = paragraph.part.rels[r_id].target_ref
-                    return url
-    except Exception as e:
-        pass
-    return None
+def paragraph_text(p_elem):
+    """Join the text nodes of a <w:p> element"""
+    return "".join(t.text or "" for t in p_elem.iter(W_T))
 
 
-def extract_hyperlink_method2(paragraph):
-    """Method 2: Check runs for hyperlinks"""
-    try:
-        for run in paragraph.runs:
-            # Check if this run has hyperlink formatting
-            if run._element.rPr is not None:
-                for elem in run._element.iter():
-                    if "hyperlink" in str(elem.tag).lower():
-                        # Try to get the relationship ID
-                        r_id = elem.get(
-                            "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
-                        )
-                        if (
-                            r_id
-                            and hasattr(paragraph.part, "rels")
-                            and r_id in paragraph.part.rels
-                        ):
-                            url = paragraph.part.rels[r_id].target_ref
-                            return url
-    except Exception as e:
-        pass
+def extract_hyperlink(p_elem, rels):
+    """Return the target of the first hyperlink in a <w:p> element"""
+    for hyperlink in p_elem.iter(W_HYPERLINK):
+        r_id = hyperlink.get(R_ID)
+        if r_id and r_id in rels:
+            return rels[r_id].target_ref
     return None
 
 
-def extract_hyperlink_method3(paragraph):
-    """Method 3: Deep dive into XML structure"""
-    try:
-        # Get the raw XML of the paragraph
-        xml_str = str(paragraph._element.xml)
+def process_articles_for_dates(articles, delay=2, max_workers=8, cache_path=None):
+    """Process all articles to get publication dates"""
+    # Articles without URLs already have status "no_url" from extraction
+    to_process = [a for a in articles if a["url"]]
+    total = len(to_process)
+    progress = count(1)
+    date_cache = load_date_cache(cache_path)
 
-        # Look for hyperlink relationships
-        hyperlink_pattern = r'r:id="(rId\d+)"'
-        matches = re.findall(hyperlink_pattern, xml_str)
+    logger.info(f"Processing {total} articles with URLs...")
 
-        for r_id in matches:
-            if hasattr(paragraph.part, "rels") and r_id in paragraph.part.rels:
-                url = paragraph.part.rels[r_id].target_ref
-                return url
+    # Group by host so different sites are fetched in parallel
+    # while each site still sees one request at a time
+    articles_by_host = defaultdict(list)
+    for article in to_process:
+        articles_by_host[urlparse(article["url"]).netloc].append(article)
+
+    def process_host_articles(host_articles):
+        fetched = 0
+        for article in host_articles:
+            processed = next(progress)
+
+            # Reuse dates extracted on a previous run
+            cached = date_cache.get(article["url"])
+            if cached:
+                logger.info(f"Cached {processed}/{total}: {article['title'][:50]}...")
+                article["publication_date"] = cached["date"]
+                article["status"] = cached["status"]
+                continue
+
+            # Add delay to be respectful to servers
+            if fetched:
+                time.sleep(delay)
+            fetched += 1
+
+            logger.info(f"Processing {processed}/{total}: {article['title'][:50]}...")
+
+            date, status = get_publication_date_from_url(
+                article["url"], article["title"]
+            )
+            article["publication_date"] = date
+            article["status"] = status
+
+            if status in CACHEABLE_STATUSES:
+                date_cache[article["url"]] = {
+                    "date": date,
+                    "status": status,
+                    "fetched_at": time.time(),
+                }
 
-    except Exception as e:
-        pass
-    return None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(process_host_articles, articles_by_host.values()))
 
+    save_date_cache(date_cache, cache_path)
+    return articles
 
-def process_articles_for_dates(articles, delay=2):
-    """Process all articles to get publication dates"""
-    articles_with_urls = [a for a in articles if a["url"]]
-    total = len(articles_with_urls)
-    processed = 0
 
-    logger.info(f"Processing {total} articles with URLs...")
+def load_date_cache(cache_path):
+    """Load dates extracted on earlier runs, keyed by URL, dropping expired entries"""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
 
-    for article in articles:
-        if not article["url"]:
-            continue
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable date cache {cache_path}: {e}")
+        return {}
 
-        processed += 1
-        logger.info(f"Processing {processed}/{total}: {article['title'][:50]}...")
+    cutoff = time.time() - DATE_CACHE_MAX_AGE
+    return {
+        url: entry
+        for url, entry in cache.items()
+        if entry.get("fetched_at", 0) >= cutoff
+    }
 
-        date, status = get_publication_date_from_url(article["url"], article["title"])
-        article["publication_date"] = date
-        article["status"] = status
 
-        # Add delay to be respectful to servers
-        if processed < total:
-            time.sleep(delay)
+def save_date_cache(cache, cache_path):
+    """Write extracted dates so later runs can skip refetching"""
+    if not cache_path:
+        return
 
-    return articles
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=1)
 
 
 def get_publication_date_from_url(url, title):
@@ -159,14 +310,20 @@ def get_publication_date_from_url(url, title):
     try:
         logger.info(f"Fetching: {url[:100]}...")
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        with HTTP_SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
 
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+            # Most pages carry the date in <head>, so stop reading there if we can
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            content = bytearray()
+            date = find_date_in_streamed_head(chunks, content)
+            if date:
+                logger.info(f"Found date: {date}")
+                return date, "success"
 
-        soup = BeautifulSoup(response.content, "html.parser")
+            content.extend(b"".join(chunks))
+
+        soup = BeautifulSoup(bytes(content), HTML_PARSER)
 
         # Try multiple methods to find publication date
         date = (
@@ -195,31 +352,55 @@ def get_publication_date_from_url(url, title):
         return None, "error"
 
 
+def find_date_in_streamed_head(chunks, content):
+    """Read the page until </head> and find a date in its meta tags.
+
+    Every chunk read is appended to content, so the caller can read the
+    rest of the page from chunks when no date is found.
+    """
+    if etree is None:
+        return None
+
+    parser = etree.HTMLPullParser(events=("end",))
+    candidates = {}
+    for chunk in chunks:
+        content.extend(chunk)
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == "meta":
+                add_meta_date_candidate(candidates, elem)
+            elif elem.tag == "head":
+                return pick_meta_date(candidates)
+
+    return None
+
+
 def find_date_in_meta_tags(soup):
     """Find date in meta tags"""
-    meta_selectors = [
-        'meta[property="article:published_time"]',
-        'meta[property="article:published"]',
-        'meta[name="publish-date"]',
-        'meta[name="publication-date"]',
-        'meta[name="date"]',
-        'meta[name="DC.date"]',
-        'meta[name="DC.Date"]',
-        'meta[property="og:published_time"]',
-        'meta[name="publishdate"]',
-        'meta[name="pub_date"]',
-        'meta[itemprop="datePublished"]',
-        'meta[itemprop="publishDate"]',
-    ]
+    candidates = {}
+    for meta in soup.find_all("meta"):
+        add_meta_date_candidate(candidates, meta)
+
+    return pick_meta_date(candidates)
+
+
+def add_meta_date_candidate(candidates, meta):
+    """Keep the first content value seen for each known meta date key"""
+    key = (
+        meta.get("property") or meta.get("name") or meta.get("itemprop") or ""
+    ).lower()
+    if key in META_DATE_KEYS and key not in candidates:
+        candidates[key] = meta.get("content") or meta.get("value")
 
-    for selector in meta_selectors:
-        meta = soup.select_one(selector)
-        if meta:
-            content = meta.get("content") or meta.get("value")
-            if content:
-                parsed_date = parse_date_string(content)
-                if parsed_date:
-                    return parsed_date
+
+def pick_meta_date(candidates):
+    """Check the meta date candidates in priority order"""
+    for key in META_DATE_KEY_PRIORITY:
+        content = candidates.get(key)
+        if content:
+            parsed_date = parse_date_string(content)
+            if parsed_date:
+                return parsed_date
 
     return None
 
@@ -230,7 +411,7 @@ def find_date_in_json_ld(soup):
         scripts = soup.find_all("script", type="application/ld+json")
         for script in scripts:
             if script.string:
-                data = json.loads(script.string)
+                data = json_loads(str(script.string))
 
                 # Handle both single objects and arrays
                 if isinstance(data, list):
@@ -294,27 +475,29 @@ def find_date_in_time_tags(soup):
 
 def find_date_in_article_tags(soup):
     """Find date in article-related elements"""
-    date_selectors = [
-        ".published-date",
-        ".publish-date",
-        ".publication-date",
-        ".date-published",
-        ".article-date",
-        ".post-date",
-        ".entry-date",
-        ".timestamp",
-        '[class*="date"]',
-        '[class*="publish"]',
-    ]
+    date = find_date_in_elements(soup.select(ARTICLE_DATE_SELECTOR))
+    if date:
+        return date
+
+    # Broader fallback: any element whose class mentions a date
+    wildcard_elements = (
+        elem
+        for elem in soup.find_all(True, class_=True)
+        if any(
+            word in " ".join(elem.get("class")) for word in WILDCARD_DATE_CLASSES
+        )
+    )
+    return find_date_in_elements(wildcard_elements)
 
-    for selector in date_selectors:
-        elements = soup.select(selector)
-        for elem in elements:
-            text = elem.get_text().strip()
-            if text and len(text) < 100:  # Reasonable length for a date
-                parsed_date = parse_date_string(text)
-                if parsed_date:
-                    return parsed_date
+
+def find_date_in_elements(elements):
+    """Return the first date parsed from the text of short elements"""
+    for elem in elements:
+        text = elem.get_text().strip()
+        if text and len(text) < 100:  # Reasonable length for a date
+            parsed_date = parse_date_string(text)
+            if parsed_date:
+                return parsed_date
 
     return None
 
@@ -322,20 +505,10 @@ def find_date_in_article_tags(soup):
 def find_date_in_text_patterns(soup):
     """Find date using text patterns in the page"""
     # Look for common date patterns in the HTML text
-    text = soup.get_text()
-
-    # Common date patterns
-    patterns = [
-        r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
-        r"Publication Date:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
-        r"(\d{1,2}/\d{1,2}/\d{4})",
-        r"(\d{4}-\d{2}-\d{2})",
-        r"([A-Za-z]+ \d{1,2},? \d{4})",
-    ]
+    text = page_text_head(soup, TEXT_PATTERN_SCAN_LIMIT)
 
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in TEXT_DATE_PATTERNS:
+        for match in pattern.findall(text):
             parsed_date = parse_date_string(match)
             if parsed_date:
                 return parsed_date
@@ -343,6 +516,19 @@ def find_date_in_text_patterns(soup):
     return None
 
 
+def page_text_head(soup, limit):
+    """Return roughly the first `limit` characters of the page text"""
+    parts = []
+    size = 0
+    for string in soup.strings:
+        parts.append(string)
+        size += len(string)
+        if size >= limit:
+            break
+
+    return "".join(parts)[:limit]
+
+
 def parse_date_string(date_str):
     """Parse various date string formats into YYYY-MM-DD format"""
     if not date_str:
@@ -351,32 +537,27 @@ def parse_date_string(date_str):
     # Clean the string
     date_str = str(date_str).strip()
 
-    # Common date formats to try
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y/%m/%d",
-        "%B %d %Y",
-        "%b %d %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-    ]
-
-    for fmt in formats:
+    # Plain ISO dates are the most common case
+    if ISO_DAY_PATTERN.fullmatch(date_str):
         try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime("%Y-%m-%d")
+            return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
         except ValueError:
+            pass
+
+    # Only try the formats whose shape matches the string
+    for pattern, formats in DATE_FORMAT_DISPATCH:
+        if not pattern.fullmatch(date_str):
             continue
 
+        for fmt in formats:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                return dt.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+
     # Try to extract just the date part if it contains extra info
-    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_str)
+    date_match = ISO_DATE_PATTERN.search(date_str)
     if date_match:
         return date_match.group(1)
 
@@ -456,7 +637,13 @@ def create_excel_file(articles, output_path):
     logger.info(f"Excel file saved successfully")
 
 
-def main(docx_path=None, output_path=None):
+def build_cache_path(output_path):
+    """Keep the date cache next to the Excel output"""
+    root, _ = os.path.splitext(output_path)
+    return f"{root}_date_cache.json"
+
+
+def main(docx_path=None, output_path=None, cache_path=None):
     """Main function"""
     # Corrected relative paths
     # docx_path = r".\Source files\Diigo New Articles.docx"
@@ -471,7 +658,9 @@ def main(docx_path=None, output_path=None):
             return
 
         # Step 2: Process articles to get publication dates
-        processed_articles = process_articles_for_dates(articles, delay=2)
+        processed_articles = process_articles_for_dates(
+            articles, delay=2, cache_path=cache_path or build_cache_path(output_path)
+        )
 
         # Step 3: Create Excel file
         create_excel_file(processed_articles, output_path)
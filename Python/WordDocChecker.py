@@ -1,9 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
 import re
 
 
-def analyze_word_document(docx_path):
-    """Analyze the Word document to see all content and identify potential articles"""
+def keyword_pattern(keywords):
+    """Compile keywords into one alternation regex for lowercased text"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Keywords used by the current detection logic
+CURRENT_KEYWORD_PATTERN = keyword_pattern(
+    ["microsoft", "ai", "anthropic", "openai", "chatgpt"]
+)
+
+# Article words and company/AI keywords used by the broader detection
+BROADER_KEYWORD_PATTERN = keyword_pattern(
+    [
+        "article",
+        "report",
+        "study",
+        "news",
+        "company",
+        "technology",
+        "microsoft",
+        "ai",
+        "anthropic",
+        "openai",
+        "chatgpt",
+        "google",
+        "amazon",
+        "meta",
+        "tesla",
+    ]
+)
+
+# Patterns used to group missed articles
+COMPANY_NAME_PATTERN = keyword_pattern(
+    ["apple", "google", "amazon", "meta", "tesla", "nvidia", "intel"]
+)
+TECH_TERM_PATTERN = keyword_pattern(
+    ["technology", "software", "tech", "digital", "innovation"]
+)
+
+NUMBERED_LIST_PATTERN = re.compile(r"\d+\.")
+
+
+def classify_paragraph(text):
+    """Classify one stripped, non-empty paragraph
+
+    Returns (reason, is_potential): reason is the current-logic match
+    ("starts_with_dash" / "contains_ai_keyword") or None, and is_potential
+    says whether the broader detection treats it as a possible article.
+    """
+    low = text.lower()
+    starts_dash = text.startswith("-")
+
+    # Current detection logic (what the program currently finds)
+    reason = None
+    if starts_dash:
+        reason = "starts_with_dash"
+    elif CURRENT_KEYWORD_PATTERN.search(low):
+        reason = "contains_ai_keyword"
+
+    # Broader detection - anything that looks like it could be an article
+    is_potential = bool(
+        len(text) > 10  # Reasonable length
+        and not text.isupper()  # Not a header
+        and not text.startswith("Page ")  # Not page number
+        and (  # Cheapest checks first
+            text.startswith(("-", "•", "*"))
+            or "http" in text  # Contains URL
+            or (text[0].isdigit() and NUMBERED_LIST_PATTERN.match(text))  # Numbered list
+            or BROADER_KEYWORD_PATTERN.search(low)
+        )
+    )
+
+    return reason, is_potential
+
+
+def analyze_word_document(docx_path, verbose=False, workers=None):
+    """Analyze the Word document to see all content and identify potential articles
+
+    Set verbose=True to also print every non-empty paragraph with its index.
+    Set workers > 1 to classify paragraphs in that many processes, which
+    only pays off for very large documents.
+    """
     print(f"Analyzing document: {docx_path}")
 
     doc = Document(docx_path)
@@ -11,77 +92,39 @@ def analyze_word_document(docx_path):
     print(f"Total paragraphs: {len(doc.paragraphs)}")
     print("=" * 80)
 
+    # (1-based index, stripped text) for every non-empty paragraph
+    paragraphs = []
+    for i, paragraph in enumerate(doc.paragraphs):
+        text = paragraph.text.strip()
+        if text:
+            paragraphs.append((i + 1, text))
+    texts = [text for _, text in paragraphs]
+
+    if workers and workers > 1:
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(classify_paragraph, texts, chunksize=chunksize))
+    else:
+        results = map(classify_paragraph, texts)
+
     # Current detection logic
     articles_found_current = []
 
     # All potential articles (broader detection)
     all_potential_articles = []
 
-    for i, paragraph in enumerate(doc.paragraphs):
-        text = paragraph.text.strip()
-
-        if not text:
-            continue
-
+    for (index, text), (reason, is_potential) in zip(paragraphs, results):
         # Show every non-empty paragraph with its index
-        print(f"Paragraph {i+1:3d}: {repr(text[:100])}...")
+        if verbose:
+            print(f"Paragraph {index:3d}: {repr(text[:100])}...")
 
-        # Current detection logic (what the program currently finds)
-        if text.startswith("-") or any(
-            keyword in text.lower()
-            for keyword in ["microsoft", "ai", "anthropic", "openai", "chatgpt"]
-        ):
+        if reason:
             articles_found_current.append(
-                {
-                    "index": i + 1,
-                    "text": text,
-                    "reason": (
-                        "starts_with_dash"
-                        if text.startswith("-")
-                        else "contains_ai_keyword"
-                    ),
-                }
+                {"index": index, "text": text, "reason": reason}
             )
 
-        # Broader detection - anything that looks like it could be an article
-        if (
-            len(text) > 10  # Reasonable length
-            and not text.isupper()  # Not a header
-            and not text.startswith("Page ")  # Not page number
-            and (
-                "http" in text  # Contains URL
-                or any(
-                    word in text.lower()
-                    for word in [
-                        "article",
-                        "report",
-                        "study",
-                        "news",
-                        "company",
-                        "technology",
-                    ]
-                )
-                or text.startswith("-")
-                or text.startswith("•")
-                or text.startswith("*")
-                or re.match(r"^\d+\.", text)  # Numbered list
-                or any(
-                    keyword in text.lower()
-                    for keyword in [
-                        "microsoft",
-                        "ai",
-                        "anthropic",
-                        "openai",
-                        "chatgpt",
-                        "google",
-                        "amazon",
-                        "meta",
-                        "tesla",
-                    ]
-                )
-            )
-        ):
-            all_potential_articles.append({"index": i + 1, "text": text})
+        if is_potential:
+            all_potential_articles.append({"index": index, "text": text})
 
     print("\n" + "=" * 80)
     print(f"CURRENT DETECTION RESULTS:")
@@ -139,28 +182,15 @@ def suggest_improved_detection(missed_articles):
 
     for article in missed_articles:
         text = article["text"]
+        low = text.lower()
 
-        if text.startswith("•") or text.startswith("*"):
+        if text.startswith(("•", "*")):
             patterns["starts_with_bullet"].append(text)
-        elif re.match(r"^\d+\.", text):
+        elif text[0].isdigit() and NUMBERED_LIST_PATTERN.match(text):
             patterns["starts_with_number"].append(text)
-        elif any(
-            company in text.lower()
-            for company in [
-                "apple",
-                "google",
-                "amazon",
-                "meta",
-                "tesla",
-                "nvidia",
-                "intel",
-            ]
-        ):
+        elif COMPANY_NAME_PATTERN.search(low):
             patterns["contains_company_names"].append(text)
-        elif any(
-            term in text.lower()
-            for term in ["technology", "software", "tech", "digital", "innovation"]
-        ):
+        elif TECH_TERM_PATTERN.search(low):
             patterns["contains_tech_terms"].append(text)
         else:
             patterns["other"].append(text)
@@ -15,13 +15,23 @@ Duplicate URLs (same URL already in that subsection) are skipped.
 Section article counts and the header total are updated automatically.
 """
 
-import csv
 import os
 import re
+from collections import defaultdict
 from datetime import date
+from functools import lru_cache
 
+import pandas as pd
 from bs4 import BeautifulSoup
 
+# Prefer the C-backed lxml parser when installed
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = 'lxml'
+except Exception:
+    HTML_PARSER = 'html.parser'
+
 # ── Paths ──────────────────────────────────────────────────────────────────────
 BASE_DIR = r'c:\Users\evanzant\Dropbox (Personal)\Projects\Diigo Management'
 HTML_PATH = os.path.join(BASE_DIR, 'Output files', 'Capstone AI articles.html')
@@ -33,9 +43,13 @@ ROMAN = {
     'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10,
 }
 
+# ── Precompiled patterns ───────────────────────────────────────────────────────
+OUTL_PATTERN      = re.compile(rf'({"|".join(ROMAN)})-([A-Z])', re.IGNORECASE)
+WORDCOUNT_PATTERN = re.compile(r'wordcount:(\d[\d,]*)')
+PUB_DATE_PATTERN  = re.compile(r'pub:(\d{4}-\d{2}-\d{2})')
 
-def roman_to_int(r: str):
-    return ROMAN.get(r.upper())
+# ── CSV columns used ───────────────────────────────────────────────────────────
+CSV_COLUMNS = ['title', 'url', 'note', 'tags']
 
 
 def outl_to_sub_id(outl_tag: str):
@@ -47,18 +61,19 @@ def outl_to_sub_id(outl_tag: str):
     if not val.startswith('_outl:'):
         return None
     val = val[6:].strip()                          # remove '_outl:' prefix
-    m = re.fullmatch(r'([IVX]+)-([A-Z])', val, re.IGNORECASE)
+    m = OUTL_PATTERN.fullmatch(val)              # only numerals in ROMAN match
     if not m:
         return None
-    num = roman_to_int(m.group(1))
-    if num is None:
-        return None
-    return f's{num}{m.group(2).lower()}'
+    return f's{ROMAN[m.group(1).upper()]}{m.group(2).lower()}'
 
 
 # ── Date helpers ───────────────────────────────────────────────────────────────
-def parse_date(s: str):
-    """Return a date object for YYYY-MM-DD strings, or None for anything else."""
+@lru_cache(maxsize=4096)
+def parse_date(s: str | None):
+    """Return a date object for YYYY-MM-DD strings, or None for anything else.
+
+    Cached: the same badge dates recur across a subsection.
+    """
     try:
         return date.fromisoformat(s)
     except (ValueError, TypeError, AttributeError):
@@ -73,6 +88,11 @@ def li_date(li) -> date | None:
     return None
 
 
+def date_sort_key(d: date | None) -> float:
+    """Ascending sort key for date-descending lists; undated items sort last."""
+    return -d.toordinal() if d is not None else float('inf')
+
+
 # ── HTML element builder ───────────────────────────────────────────────────────
 def make_li(soup, title: str, url: str, pub_date: str | None, wordcount: int | None):
     """
@@ -107,6 +127,24 @@ def make_li(soup, title: str, url: str, pub_date: str | None, wordcount: int | N
     return li
 
 
+def merge_into_list(ul, items):
+    """
+    Insert new (sort key, <li>) items into a date-descending <ul> in one pass.
+
+    Each item goes before the first existing <li> that is undated OR older;
+    items with equal keys keep their original order, after existing ones.
+    """
+    existing = [(date_sort_key(li_date(li)), li) for li in ul.find_all('li')]
+    i = 0
+    for key, new_li in sorted(items, key=lambda item: item[0]):
+        while i < len(existing) and existing[i][0] <= key:
+            i += 1
+        if i < len(existing):
+            existing[i][1].insert_before(new_li)
+        else:
+            ul.append(new_li)
+
+
 # ── CSV parsing ────────────────────────────────────────────────────────────────
 def load_csv(csv_path: str) -> list[dict]:
     """
@@ -114,44 +152,47 @@ def load_csv(csv_path: str) -> list[dict]:
       title, url, pub_date (str or None), wordcount (int or None), sub_id (str)
     One entry per _outl: tag per row.
     """
-    articles = []
-    with open(csv_path, newline='', encoding='utf-8') as fh:
-        for row in csv.DictReader(fh):
-            title    = (row.get('title') or '').strip()
-            url      = (row.get('url')   or '').strip()
-            note     = (row.get('note')  or '').strip()
-            tags_raw = (row.get('tags')  or '').strip()
-
-            if not title or not url:
-                continue
-
-            # wordcount from note field
-            wc_m  = re.search(r'wordcount:(\d[\d,]*)', note)
-            wordcount = int(wc_m.group(1).replace(',', '')) if wc_m else None
-
-            # pub date from note field
-            pub_m    = re.search(r'pub:(\d{4}-\d{2}-\d{2})', note)
-            pub_date = pub_m.group(1) if pub_m else None
-
-            # collect _outl: tags
-            for tag in (t.strip() for t in tags_raw.split(',')):
-                sub_id = outl_to_sub_id(tag)
-                if sub_id:
-                    articles.append(dict(
-                        title=title,
-                        url=url,
-                        pub_date=pub_date,
-                        wordcount=wordcount,
-                        sub_id=sub_id,
-                    ))
-    return articles
+    df = pd.read_csv(
+        csv_path,
+        dtype=str,
+        keep_default_na=False,
+        usecols=lambda col: col in CSV_COLUMNS,
+    )
+    df = df.reindex(columns=CSV_COLUMNS).fillna('')
+    for col in CSV_COLUMNS:
+        df[col] = df[col].str.strip()
+    df = df[(df['title'] != '') & (df['url'] != '')]
+
+    # wordcount and pub date from note field, extracted column-wise
+    wordcounts = (df['note'].str.extract(WORDCOUNT_PATTERN, expand=False)
+                  .str.replace(',', '', regex=False))
+    pub_dates  = df['note'].str.extract(PUB_DATE_PATTERN, expand=False)
+
+    # one row per comma-separated tag, kept only for valid _outl: tags
+    df = (df.assign(wordcount=wordcounts, pub_date=pub_dates,
+                    tag=df['tags'].str.split(','))
+          .explode('tag'))
+    df['sub_id'] = df['tag'].str.strip().map(outl_to_sub_id)
+    df = df[df['sub_id'].notna()]
+
+    return [
+        dict(
+            title=title,
+            url=url,
+            pub_date=pub_date if isinstance(pub_date, str) else None,
+            wordcount=int(wordcount) if isinstance(wordcount, str) else None,
+            sub_id=sub_id,
+        )
+        for title, url, pub_date, wordcount, sub_id in zip(
+            df['title'], df['url'], df['pub_date'], df['wordcount'], df['sub_id'])
+    ]
 
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 def main():
     # ── Load HTML ──────────────────────────────────────────────────────────────
-    with open(HTML_PATH, encoding='utf-8') as fh:
-        soup = BeautifulSoup(fh.read(), 'html.parser')
+    with open(HTML_PATH, 'rb') as fh:                # parser decodes the bytes
+        soup = BeautifulSoup(fh, HTML_PARSER)
 
     # ── Load CSV ───────────────────────────────────────────────────────────────
     new_articles = load_csv(CSV_PATH)
@@ -159,6 +200,25 @@ def main():
         print('No articles found in CSV.')
         return
 
+    # Index every <details> by id once instead of searching per article
+    details_by_id = {d['id']: d for d in soup.find_all('details', id=True)}
+    ul_cache: dict = {}
+    # sub_id → set of hrefs already in that subsection's list
+    url_cache: dict[str, set[str]] = {}
+    # sub_id → [(sort key, new <li>), ...] waiting to be merged, in CSV order
+    pending: dict[str, list[tuple[float, object]]] = defaultdict(list)
+
+    # Count existing articles per top-level section in one pass; inserts
+    # below bump these counters instead of recounting the tree at the end
+    sec_counts: dict[str, int] = defaultdict(int)
+    total = 0
+    for ul in soup.find_all('ul', class_='arts'):
+        n = len(ul.find_all('li'))
+        total += n
+        sec_el = ul.find_parent('details', class_='sec')
+        if sec_el:
+            sec_counts[sec_el.get('id', '')] += n
+
     added = 0
     skipped = 0
     modified_sec_ids: set[str] = set()
@@ -167,21 +227,25 @@ def main():
         sub_id = art['sub_id']
 
         # Find subsection
-        sub_el = soup.find('details', id=sub_id)
+        sub_el = details_by_id.get(sub_id)
         if not sub_el:
             print(f'  WARNING: subsection "{sub_id}" not found  — skipping "{art["title"]}"')
             skipped += 1
             continue
 
         # Find article list
-        ul = sub_el.find('ul', class_='arts')
+        if sub_id not in ul_cache:
+            ul_cache[sub_id] = sub_el.find('ul', class_='arts')
+        ul = ul_cache[sub_id]
         if not ul:
             print(f'  WARNING: no <ul class="arts"> in "{sub_id}" — skipping "{art["title"]}"')
             skipped += 1
             continue
 
         # Duplicate-URL check
-        existing_urls = {a['href'] for a in ul.find_all('a', href=True)}
+        if sub_id not in url_cache:
+            url_cache[sub_id] = {a['href'] for a in ul.find_all('a', href=True)}
+        existing_urls = url_cache[sub_id]
         if art['url'] in existing_urls:
             print(f'  SKIP (already present in {sub_id}): {art["title"]}')
             skipped += 1
@@ -191,33 +255,30 @@ def main():
         new_li   = make_li(soup, art['title'], art['url'], art['pub_date'], art['wordcount'])
         new_date = parse_date(art['pub_date'])
 
-        # Insert at correct position (descending date order)
-        inserted = False
-        if new_date is not None:
-            for existing_li in ul.find_all('li'):
-                ex_date = li_date(existing_li)
-                # Insert before first item that is undated OR older than new article
-                if ex_date is None or new_date > ex_date:
-                    existing_li.insert_before(new_li)
-                    inserted = True
-                    break
-        if not inserted:
-            ul.append(new_li)
+        pending[sub_id].append((date_sort_key(new_date), new_li))
+        existing_urls.add(art['url'])
 
         # Track which top-level section was changed
         sec_el = sub_el.find_parent('details', class_='sec')
         if sec_el:
-            modified_sec_ids.add(sec_el.get('id', ''))
+            sec_id = sec_el.get('id', '')
+            modified_sec_ids.add(sec_id)
+            sec_counts[sec_id] += 1
 
+        total += 1
         added += 1
         print(f'  Added to {sub_id}: {art["title"]}')
 
+    # ── Merge new articles into each subsection ───────────────────────────────
+    for sub_id, items in pending.items():
+        merge_into_list(ul_cache[sub_id], items)
+
     # ── Update per-section article counts ─────────────────────────────────────
     for sec_id in modified_sec_ids:
-        sec_el = soup.find('details', id=sec_id)
+        sec_el = details_by_id.get(sec_id)
         if not sec_el:
             continue
-        count = sum(len(ul.find_all('li')) for ul in sec_el.find_all('ul', class_='arts'))
+        count = sec_counts[sec_id]
         summary = sec_el.find('summary', recursive=False)
         if summary:
             span = summary.find('span', class_='art-count')
@@ -225,7 +286,6 @@ def main():
                 span.string = f'({count} articles)'
 
     # ── Update header total ────────────────────────────────────────────────────
-    total = sum(len(ul.find_all('li')) for ul in soup.find_all('ul', class_='arts'))
     header = soup.find('header')
     if header:
         p = header.find('p')
@@ -233,8 +293,8 @@ def main():
             p.string = re.sub(r'\d+ articles', f'{total} articles', p.get_text())
 
     # ── Write HTML ─────────────────────────────────────────────────────────────
-    with open(HTML_PATH, 'w', encoding='utf-8') as fh:
-        fh.write(str(soup))
+    with open(HTML_PATH, 'wb') as fh:
+        fh.write(soup.encode('utf-8'))
 
     print(f'\nDone. Added {added}, skipped {skipped}.')
     print(f'Saved: {HTML_PATH}')
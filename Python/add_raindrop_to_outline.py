@@ -11,81 +11,125 @@ Usage examples
   python add_raindrop_to_outline.py --no-fetch    # CSV signals only
   python add_raindrop_to_outline.py --dry-run     # classify + report, no output
   python add_raindrop_to_outline.py --verbose     # show per-article placement
+  python add_raindrop_to_outline.py --no-cache    # refetch URLs cached by earlier runs
 """
 
 import argparse
+import json
 import logging
 import re
 import time
-from collections import Counter
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlsplit
 
+import numpy as np
 import pandas as pd
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "a", "an", "and", "are", "as", "at", "be", "by", "can", "did", "do", "for",
     "from", "has", "have", "how", "in", "is", "it", "its", "of", "on", "or",
     "our", "says", "so", "than", "that", "the", "this", "to", "up", "us",
     "was", "we", "what", "when", "where", "which", "who", "why", "will", "with",
     "you", "your", "ai", "artificial", "intelligence",
-}
+})
 
-SECTION_HINTS: Dict[str, set] = {
-    "s1": {
+SECTION_HINTS: Dict[str, frozenset] = {
+    "s1": frozenset({
         "llm", "llms", "model", "models", "hallucination", "hallucinations", "rag",
         "benchmark", "benchmarks", "benchmarking", "architecture", "training",
         "inference", "reasoning", "transformer", "diffusion", "embedding", "token",
         "tokens", "tokenizer", "parameter", "parameters", "pretraining", "finetuning",
         "multimodal", "vision", "image", "video", "generation", "language",
-    },
-    "s2": {
+    }),
+    "s2": frozenset({
         "tool", "tools", "workflow", "prompt", "prompting", "coding", "code",
         "productivity", "search", "assistant", "copilot", "plugin", "browser",
         "extension", "summarize", "summarization", "ocr", "document", "spreadsheet",
         "excel", "pdf", "notebooklm", "perplexity", "replit", "writing",
-    },
-    "s3": {
+    }),
+    "s3": frozenset({
         "agent", "agents", "agentic", "autonomous", "orchestration", "multiagent",
         "multi-agent", "openclaw", "moltbook", "workflow", "automation", "automate",
         "deploy", "deployment", "mcp", "protocol",
-    },
-    "s4": {
+    }),
+    "s4": frozenset({
         "safety", "ethics", "ethical", "alignment", "misuse", "policy", "legal",
         "regulatory", "regulation", "law", "risk", "governance", "security",
         "privacy", "bias", "misinformation", "deepfake", "harm", "danger",
         "threat", "censor", "censorship", "rights",
-    },
-    "s5": {
+    }),
+    "s5": frozenset({
         "education", "educational", "student", "students", "teaching", "learning",
         "classroom", "school", "university", "college", "course", "curriculum",
         "academic", "professor", "homework",
-    },
-    "s6": {
+    }),
+    "s6": frozenset({
         "cognitive", "cognition", "psychology", "psychological", "neuroscience",
         "brain", "behavior", "behaviour", "human", "mind", "consciousness",
         "emotion", "mental", "perception", "memory",
-    },
-    "s7": {
+    }),
+    "s7": frozenset({
         "economy", "economic", "jobs", "job", "labor", "labour", "work", "workforce",
         "society", "societal", "social", "business", "industry", "industries",
         "advertising", "corporate", "company", "companies", "inequality", "wage",
         "employment", "unemployment", "copyright", "art", "creative",
-    },
-    "s8": {
+    }),
+    "s8": frozenset({
         "science", "biology", "health", "medicine", "medical", "climate",
         "environment", "environmental", "research", "discovery", "physics",
         "chemistry", "drug", "drugs", "genomics", "protein", "astronomy",
-    },
+    }),
 }
 
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-']+")
+PUB_NOTE_PATTERN = re.compile(r"pub\s*:\s*(\d{4}-\d{2}-\d{2})")
+WORDCOUNT_NOTE_PATTERN = re.compile(r"wordcount\s*:\s*(\d+)", re.IGNORECASE)
+ISO_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Raindrop export columns read by update_outline; the rest are never parsed
+CSV_COLUMNS = frozenset({
+    "title", "url", "tags", "note", "excerpt",
+    "publication_date", "pub_date", "date", "created",
+    "wordcount", "word_count",
+})
+
+# Date badge on an outline <li>; undated items sort last
+DATE_BADGE_SELECTOR = soupsieve.compile("span.bd.bd-d")
+UNDATED = datetime(1900, 1, 1)
+
+# Only the head of a page is needed for classification signals
+MAX_PAGE_BYTES = 512 * 1024
+STREAM_CHUNK_SIZE = 65536
+
+# Signals from successful fetches are reused for 30 days
+FETCH_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+CACHED_SIGNAL_FIELDS = (
+    "fetched_title",
+    "fetched_description",
+    "fetched_keywords",
+    "fetched_headings",
+    "fetched_body",
+)
+
 REQUEST_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -111,20 +155,24 @@ class ArticleSignals:
     fetched_body: str = ""
     fetch_ok: bool = False
 
-    def combined_text(self) -> str:
-        parts = [
+    def token_sets(self) -> Tuple[set, set, set]:
+        """(main, tag, body) token sets, tokenizing each field once.
+
+        Main covers title, tags, note, excerpt and the fetched metadata; as
+        tokens never span fields it is built from the tag tokens plus the rest.
+        """
+        tag_tokens = set(tokenize(self.tags))
+        rest = [
             self.fetched_title or self.title,
-            self.tags,
             self.note,
             self.excerpt,
             self.fetched_description,
             self.fetched_keywords,
             self.fetched_headings,
         ]
-        return " ".join(p for p in parts if p)
-
-    def body_text(self) -> str:
-        return self.fetched_body
+        main_tokens = tag_tokens.union(tokenize(" ".join(p for p in rest if p)))
+        body_tokens = set(tokenize(self.fetched_body))
+        return main_tokens, tag_tokens, body_tokens
 
     def display_title(self) -> str:
         return self.title or self.fetched_title
@@ -138,11 +186,25 @@ class SubsectionProfile:
     summary_tokens: set
     title_tokens: Counter
     ul_node: object
+    hint_set: frozenset = frozenset()
+    title_bounded: Dict[str, int] = field(default_factory=dict)   # counts capped at 3
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Cached: tags and outline titles repeat across articles and subsections."""
+    words = TOKEN_PATTERN.findall((text or "").lower())
+    return tuple(w for w in words if len(w) > 2 and w not in STOPWORDS)
 
 
-def tokenize(text: str) -> List[str]:
-    words = re.findall(r"[a-z0-9][a-z0-9\-']+", (text or "").lower())
-    return [w for w in words if len(w) > 2 and w not in STOPWORDS]
+def canonical_url(url: str) -> Tuple[str, str, str, str]:
+    """Key for duplicate checks: ignores host case, a leading www., the
+    fragment and a trailing slash."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return parts.scheme.lower(), host, parts.path.rstrip("/"), parts.query
 
 
 def _meta_content(soup: BeautifulSoup, *selectors: str) -> str:
@@ -157,14 +219,26 @@ def fetch_article_signals(url: str, session: requests.Session, timeout: int = 12
     """Fetch a URL and extract classification signals."""
     sig = ArticleSignals()
     try:
-        resp = session.get(url, headers=REQUEST_HEADERS, timeout=timeout, allow_redirects=True)
-        if resp.status_code != 200:
-            logger.debug("HTTP %s for %s", resp.status_code, url)
-            return sig
-        if "html" not in resp.headers.get("content-type", ""):
-            return sig
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+        with session.get(
+            url, headers=REQUEST_HEADERS, timeout=timeout, allow_redirects=True, stream=True
+        ) as resp:
+            if resp.status_code != 200:
+                logger.debug("HTTP %s for %s", resp.status_code, url)
+                return sig
+            # Checked before any of the body is downloaded
+            if "html" not in resp.headers.get("content-type", ""):
+                return sig
+
+            chunks = []
+            size = 0
+            for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            content = b"".join(chunks)[:MAX_PAGE_BYTES]
+
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         sig.fetched_title = (
             _meta_content(soup, 'meta[property="og:title"]')
@@ -202,45 +276,86 @@ def fetch_article_signals(url: str, session: requests.Session, timeout: int = 12
     return sig
 
 
-def parse_pub_date(row: pd.Series) -> str:
-    note = str(row.get("note", "") or "")
-    m = re.search(r"pub\s*:\s*(\d{4}-\d{2}-\d{2})", note)
-    if m:
-        return m.group(1)
+def fetch_all_signals(
+    urls: List[str],
+    session: requests.Session,
+    timeout: int,
+    delay: float,
+    max_workers: int,
+) -> Dict[str, ArticleSignals]:
+    """Fetch signals for each URL; hosts run in parallel, each paced by `delay`."""
+    urls_by_host: Dict[str, List[str]] = defaultdict(list)
+    for url in urls:
+        urls_by_host[urlparse(url).netloc].append(url)
+
+    results: Dict[str, ArticleSignals] = {}
 
-    for field in ("publication_date", "pub_date", "date"):
-        value = row.get(field)
-        if pd.notna(value):
-            text = str(value)
-            m = re.search(r"(\d{4}-\d{2}-\d{2})", text)
-            if m:
-                return m.group(1)
+    def fetch_host(host_urls: List[str]) -> None:
+        for i, url in enumerate(host_urls):
+            if i and delay > 0:
+                time.sleep(delay)
+            results[url] = fetch_article_signals(url, session, timeout=timeout)
 
-    created = row.get("created")
-    if pd.notna(created):
-        text = str(created)
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", text)
-        if m:
-            return m.group(1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch_host, urls_by_host.values()))
+    return results
 
-    return "1900-01-01"
 
+def load_fetch_cache(cache_path: Optional[Path]) -> Dict[str, dict]:
+    """Load signals fetched on earlier runs, keyed by URL, dropping expired entries."""
+    if cache_path is None or not cache_path.exists():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable fetch cache %s: %s", cache_path, exc)
+        return {}
+    cutoff = time.time() - FETCH_CACHE_MAX_AGE
+    return {url: entry for url, entry in cache.items() if entry.get("fetched_at", 0) >= cutoff}
 
-def parse_wordcount(row: pd.Series) -> Optional[int]:
-    note = str(row.get("note", "") or "")
-    m = re.search(r"wordcount\s*:\s*(\d+)", note, flags=re.IGNORECASE)
-    if m:
-        return int(m.group(1))
 
-    for field in ("wordcount", "word_count"):
-        value = row.get(field)
-        if pd.notna(value):
-            try:
-                return int(float(value))
-            except Exception:
-                continue
+def save_fetch_cache(cache: Dict[str, dict], cache_path: Optional[Path]) -> None:
+    if cache_path is not None:
+        cache_path.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+
 
-    return None
+def text_column(df: pd.DataFrame, name: str) -> List[str]:
+    """Values of a CSV column as str(value or ""); all "" if the column is missing."""
+    if name not in df.columns:
+        return [""] * len(df)
+    return [str(v or "") for v in df[name].tolist()]
+
+
+def parse_pub_dates(df: pd.DataFrame) -> List[str]:
+    """Publication date per row: 'pub:' in the note, then the first ISO date
+    in publication_date / pub_date / date / created, else 1900-01-01."""
+    dates = pd.Series(text_column(df, "note"), index=df.index).str.extract(
+        PUB_NOTE_PATTERN, expand=False
+    )
+    for field in ("publication_date", "pub_date", "date", "created"):
+        if field in df.columns:
+            values = df[field][df[field].notna()]
+            dates = dates.fillna(values.astype(str).str.extract(ISO_DATE_PATTERN, expand=False))
+    return dates.fillna("1900-01-01").tolist()
+
+
+def parse_wordcounts(df: pd.DataFrame) -> List[Optional[int]]:
+    """Word count per row: 'wordcount:' in the note, then the wordcount /
+    word_count columns, else None."""
+    counts = pd.Series(text_column(df, "note"), index=df.index).str.extract(
+        WORDCOUNT_NOTE_PATTERN, expand=False
+    )
+    result: List[Optional[int]] = [int(c) if isinstance(c, str) else None for c in counts.tolist()]
+    for field in ("wordcount", "word_count"):
+        if field not in df.columns:
+            continue
+        for i, value in enumerate(df[field].tolist()):
+            if result[i] is None and pd.notna(value):
+                try:
+                    result[i] = int(float(value))
+                except Exception:
+                    continue
+    return result
 
 
 def build_profiles(soup: BeautifulSoup) -> List[SubsectionProfile]:
@@ -268,24 +383,55 @@ def build_profiles(soup: BeautifulSoup) -> List[SubsectionProfile]:
             summary_tokens=summary_tokens,
             title_tokens=title_counter,
             ul_node=ul_node,
+            hint_set=SECTION_HINTS.get(section_id, frozenset()),
+            title_bounded={t: min(c, 3) for t, c in title_counter.items()},
         ))
     return profiles
 
 
-def score_subsection(
-    profile: SubsectionProfile,
+@dataclass
+class ProfileMatrix:
+    """Profile token counts laid out per token, for scoring all profiles at once.
+
+    counts[vocab[token]] is a (3, profiles) block: whether the token is in
+    each subsection heading, whether it is a hint for the parent section,
+    and its existing-title count capped at 3.
+    """
+    vocab: Dict[str, int]
+    counts: np.ndarray
+
+
+def build_profile_matrix(profiles: List[SubsectionProfile]) -> ProfileMatrix:
+    vocab: Dict[str, int] = {}
+    for p in profiles:
+        for tok in (*p.summary_tokens, *p.hint_set, *p.title_bounded):
+            vocab.setdefault(tok, len(vocab))
+
+    counts = np.zeros((len(vocab), 3, len(profiles)), dtype=np.int32)
+    for col, p in enumerate(profiles):
+        counts[[vocab[t] for t in p.summary_tokens], 0, col] = 1
+        counts[[vocab[t] for t in p.hint_set], 1, col] = 1
+        for tok, n in p.title_bounded.items():
+            counts[vocab[tok], 2, col] = n
+    return ProfileMatrix(vocab=vocab, counts=counts)
+
+
+def score_subsections(
+    matrix: ProfileMatrix,
     main_tokens: set,
     tag_tokens: set,
     body_tokens: set,
-) -> float:
-    section_hints = SECTION_HINTS.get(profile.section_id, set())
-    heading_overlap_main = len(main_tokens & profile.summary_tokens)
-    heading_overlap_tags = len(tag_tokens & profile.summary_tokens)
-    hint_overlap_main = len(main_tokens & section_hints)
-    hint_overlap_tags = len(tag_tokens & section_hints)
-    hint_overlap_body = len(body_tokens & section_hints)
-    title_cooccur = sum(min(profile.title_tokens.get(t, 0), 3) for t in main_tokens)
-    body_heading_overlap = len(body_tokens & profile.summary_tokens)
+) -> np.ndarray:
+    """Score every profile; each token set is one contiguous row gather."""
+    vocab = matrix.vocab
+    counts = matrix.counts
+    main = counts[[vocab[t] for t in main_tokens if t in vocab]].sum(axis=0)
+    tags = counts[[vocab[t] for t in tag_tokens if t in vocab]].sum(axis=0)
+    body = counts[[vocab[t] for t in body_tokens if t in vocab]].sum(axis=0)
+
+    heading_overlap_main, hint_overlap_main, title_cooccur = main
+    heading_overlap_tags, hint_overlap_tags, _ = tags
+    body_heading_overlap, hint_overlap_body, _ = body
     return (
         5.0 * heading_overlap_tags
         + 3.0 * heading_overlap_main
@@ -301,18 +447,17 @@ def best_subsections(
     profiles: List[SubsectionProfile],
     signals: ArticleSignals,
     max_sections: int,
+    matrix: Optional[ProfileMatrix] = None,
 ) -> List[SubsectionProfile]:
-    main_tokens = set(tokenize(signals.combined_text()))
-    tag_tokens = set(tokenize(signals.tags))
-    body_tokens = set(tokenize(signals.body_text()))
+    main_tokens, tag_tokens, body_tokens = signals.token_sets()
 
     if not main_tokens and not tag_tokens and not body_tokens:
         return [profiles[0]] if profiles else []
 
-    scored: List[Tuple[float, SubsectionProfile]] = [
-        (score_subsection(p, main_tokens, tag_tokens, body_tokens), p)
-        for p in profiles
-    ]
+    if matrix is None:
+        matrix = build_profile_matrix(profiles)
+    scores = score_subsections(matrix, main_tokens, tag_tokens, body_tokens)
+    scored: List[Tuple[float, SubsectionProfile]] = list(zip(scores.tolist(), profiles))
     scored.sort(key=lambda x: x[0], reverse=True)
     if not scored:
         return []
@@ -366,22 +511,42 @@ def create_article_li(
 
 
 def parse_li_date(li_node) -> datetime:
-    date_span = li_node.select_one("span.bd.bd-d")
+    date_span = DATE_BADGE_SELECTOR.select_one(li_node)
     if date_span:
         txt = date_span.get_text(strip=True)
+        # Badges are normally plain ISO dates; strptime handles the rest
+        if ISO_DATE_PATTERN.fullmatch(txt):
+            try:
+                return datetime.fromisoformat(txt)
+            except ValueError:
+                pass
         try:
             return datetime.strptime(txt, "%Y-%m-%d")
         except Exception:
             pass
-    return datetime(1900, 1, 1)
+    return UNDATED
 
 
-def sort_all_subsections_by_date(soup: BeautifulSoup):
+def sort_all_subsections_by_date(
+    soup: BeautifulSoup, new_items: Optional[Dict[int, list]] = None
+) -> None:
+    """Sort every article list newest first.
+
+    `new_items` maps id(ul) to <li> tags not yet in that list; they are
+    merged in as if they had been appended before sorting.
+    """
+    new_items = new_items or {}
     for ul in soup.select("details.sub ul.arts"):
-        items = [li for li in ul.find_all("li", recursive=False)]
-        items.sort(key=parse_li_date, reverse=True)
+        items = ul.find_all("li", recursive=False) + new_items.get(id(ul), [])
+        # sort() computes each item's date once
+        ordered = sorted(items, key=parse_li_date, reverse=True)
+        # Lists that are already sorted and hold only <li> children stay as they are
+        if len(ul.contents) == len(ordered) and all(
+            a is b for a, b in zip(ul.contents, ordered)
+        ):
+            continue
         ul.clear()
-        for li in items:
+        for li in ordered:
             ul.append(li)
 
 
@@ -406,12 +571,15 @@ def refresh_counts(soup: BeautifulSoup) -> None:
         )
 
 
-def build_session() -> requests.Session:
+def build_session(pool_size: int = 32) -> requests.Session:
     from requests.adapters import HTTPAdapter
     from urllib3.util.retry import Retry
     sess = requests.Session()
     retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
-    adapter = HTTPAdapter(max_retries=retry)
+    # Enough kept-alive connections per host for every worker thread
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+    )
     sess.mount("http://", adapter)
     sess.mount("https://", adapter)
     return sess
@@ -427,39 +595,89 @@ def update_outline(
     fetch_delay: float,
     fetch_timeout: int,
     verbose: bool,
+    fetch_workers: int = 8,
+    cache_path: Optional[Path] = None,
 ) -> None:
     soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "html.parser")
     profiles = build_profiles(soup)
     if not profiles:
         raise RuntimeError("No subsection profiles found in outline HTML.")
+    matrix = build_profile_matrix(profiles)
 
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, usecols=lambda col: col in CSV_COLUMNS)
+    titles = [t.strip() for t in text_column(df, "title")]
+    urls = [u.strip() for u in text_column(df, "url")]
     existing_urls = {
-        (a.get("href") or "").strip()
+        canonical_url(a.get("href") or "")
         for a in soup.select("details.sub ul.arts li a[href]")
     }
 
-    session = build_session() if fetch_urls else None
-    inserted = skipped = fetch_ok_count = fetch_fail_count = 0
+    prefetched: Dict[str, ArticleSignals] = {}
+    if fetch_urls:
+        # Fetch every URL that will be inserted up front, in parallel
+        to_fetch: List[str] = []
+        seen = set(existing_urls)
+        for title, url in zip(titles, urls):
+            if not title or not url:
+                continue
+            url_key = canonical_url(url)
+            if url_key not in seen:
+                seen.add(url_key)
+                to_fetch.append(url)
+
+        cache = load_fetch_cache(cache_path)
+        prefetched = {
+            url: ArticleSignals(fetch_ok=True, **{f: cache[url][f] for f in CACHED_SIGNAL_FIELDS})
+            for url in to_fetch
+            if url in cache
+        }
+        if prefetched:
+            logger.info("Using cached signals for %d URLs", len(prefetched))
+
+        fetched = fetch_all_signals(
+            [url for url in to_fetch if url not in prefetched],
+            build_session(max(32, fetch_workers)), fetch_timeout, fetch_delay, fetch_workers,
+        )
+        prefetched.update(fetched)
+
+        if cache_path is not None:
+            now = time.time()
+            for url, sig in fetched.items():
+                if sig.fetch_ok:
+                    cache[url] = {f: getattr(sig, f) for f in CACHED_SIGNAL_FIELDS}
+                    cache[url]["fetched_at"] = now
+            save_fetch_cache(cache, cache_path)
 
-    for _, row in df.iterrows():
-        title = str(row.get("title", "") or "").strip()
-        url = str(row.get("url", "") or "").strip()
+    inserted = skipped = fetch_ok_count = fetch_fail_count = 0
+    # id(ul) → new <li> tags, added to the tree once while sorting
+    pending: Dict[int, list] = defaultdict(list)
+
+    rows = zip(
+        titles,
+        urls,
+        text_column(df, "tags"),
+        text_column(df, "note"),
+        text_column(df, "excerpt"),
+        parse_pub_dates(df),
+        parse_wordcounts(df),
+    )
+    for title, url, tags, note, excerpt, pub_date, wc in rows:
         if not title or not url:
             continue
-        if url in existing_urls:
+        url_key = canonical_url(url)
+        if url_key in existing_urls:
             skipped += 1
             continue
 
         signals = ArticleSignals(
             title=title,
-            tags=str(row.get("tags", "") or ""),
-            note=str(row.get("note", "") or ""),
-            excerpt=str(row.get("excerpt", "") or ""),
+            tags=tags,
+            note=note,
+            excerpt=excerpt,
         )
 
-        if fetch_urls and session is not None:
-            fetched = fetch_article_signals(url, session, timeout=fetch_timeout)
+        if fetch_urls:
+            fetched = prefetched[url]
             signals.fetched_title = fetched.fetched_title
             signals.fetched_description = fetched.fetched_description
             signals.fetched_keywords = fetched.fetched_keywords
@@ -470,15 +688,13 @@ def update_outline(
                 fetch_ok_count += 1
             else:
                 fetch_fail_count += 1
-            if fetch_delay > 0:
-                time.sleep(fetch_delay)
 
-        targets = best_subsections(profiles, signals, max_sections=max_sections_per_article)
+        targets = best_subsections(
+            profiles, signals, max_sections=max_sections_per_article, matrix=matrix
+        )
         if not targets:
             continue
 
-        pub_date = parse_pub_date(row)
-        wc = parse_wordcount(row)
         display_title = signals.display_title()
 
         if verbose:
@@ -492,12 +708,12 @@ def update_outline(
                 refs = [f"§{t.section_id[1:].upper()}-{t.sub_id[-1].upper()}" for t in targets[1:]]
                 cross_ref = f"→ also in {', '.join(refs)}"
             li = create_article_li(soup, display_title, url, pub_date, wc, cross_ref)
-            target.ul_node.append(li)
+            pending[id(target.ul_node)].append(li)
 
-        existing_urls.add(url)
+        existing_urls.add(url_key)
         inserted += 1
 
-    sort_all_subsections_by_date(soup)
+    sort_all_subsections_by_date(soup, pending)
     refresh_counts(soup)
 
     print(f"\nInserted  : {inserted} new articles")
@@ -542,7 +758,15 @@ def main() -> None:
     )
     parser.add_argument(
         "--fetch-delay", type=float, default=1.5,
-        help="Seconds to wait between fetches (default 1.5)",
+        help="Seconds to wait between fetches from the same host (default 1.5)",
+    )
+    parser.add_argument(
+        "--fetch-workers", type=int, default=8,
+        help="Number of hosts to fetch from in parallel (default 8)",
+    )
+    parser.add_argument(
+        "--no-cache", dest="use_cache", action="store_false", default=True,
+        help="Refetch every URL instead of reusing signals cached next to the output",
     )
     parser.add_argument(
         "--fetch-timeout", type=int, default=12,
@@ -577,6 +801,11 @@ def main() -> None:
         fetch_delay=args.fetch_delay,
         fetch_timeout=args.fetch_timeout,
         verbose=args.verbose,
+        fetch_workers=max(1, args.fetch_workers),
+        cache_path=(
+            output_path.with_name(f"{output_path.stem}_fetch_cache.json")
+            if args.use_cache else None
+        ),
     )
 
 
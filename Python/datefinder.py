@@ -4,34 +4,171 @@ import logging
 import os
 import re
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+
+    def json_loads(text):
+        """Decode with orjson, retrying with json for input only it accepts (NaN, lone surrogates)"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+except Exception:
+    json_loads = json.loads
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Date patterns searched in page text, compiled once and tried in order
+TEXT_DATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
+        r"Publication Date:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
+        r"(\d{1,2}/\d{1,2}/\d{4})",
+        r"(\d{4}-\d{2}-\d{2})",
+        r"([A-Za-z]+ \d{1,2},? \d{4})",
+    ]
+)
 
-def get_publication_date_from_url(url):
-    """Visit URL and extract publication date."""
-    try:
-        headers = {
+# Only this much of the page text is scanned unless nothing is found in it
+TEXT_PATTERN_SCAN_LIMIT = 200_000
+
+# Each pattern accepts every string its formats can parse, so a string
+# is only handed to strptime with formats that can actually match it
+DATE_FORMAT_DISPATCH = tuple(
+    (re.compile(pattern, re.IGNORECASE), formats)
+    for pattern, formats in [
+        (r"\d{4}-\d{1,2}- ?\d{1,2}", ("%Y-%m-%d",)),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}",
+            ("%Y-%m-%dT%H:%M:%S",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}Z",
+            ("%Y-%m-%dT%H:%M:%SZ",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}\.\d{1,6}Z",
+            ("%Y-%m-%dT%H:%M:%S.%fZ",),
+        ),
+        (r"[a-z]+\s+ ?\d{1,2},\s*\d{4}", ("%B %d, %Y", "%b %d, %Y")),
+        (r" ?\d{1,2}/ ?\d{1,2}/\d{4}", ("%m/%d/%Y", "%d/%m/%Y")),
+        (r"\d{4}/\d{1,2}/ ?\d{1,2}", ("%Y/%m/%d",)),
+        (r"[a-z]+\s+ ?\d{1,2}\s+\d{4}", ("%B %d %Y", "%b %d %Y")),
+        (r" ?\d{1,2}\s+[a-z]+\s+\d{4}", ("%d %B %Y", "%d %b %Y")),
+    ]
+)
+ISO_DAY_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+ISO_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# JSON-LD fields checked for a date, in priority order; blocks that name
+# none of them are skipped without being parsed
+JSON_LD_DATE_FIELDS = ("datePublished", "publishDate", "dateCreated", "uploadDate")
+JSON_LD_DATE_FIELD_PATTERN = re.compile(
+    '"(?:' + "|".join(JSON_LD_DATE_FIELDS) + ')"'
+)
+
+
+def build_http_session():
+    """Shared session so connections are kept alive and reused per host"""
+    session = requests.Session()
+    session.headers.update(
+        {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/91.0.4472.124 Safari/537.36"
             )
         }
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
+# CSS selectors for date elements, compiled once and tried in priority order
+META_DATE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in [
+        'meta[property="article:published_time"]',
+        'meta[property="article:published"]',
+        'meta[name="publish-date"]',
+        'meta[name="publication-date"]',
+        'meta[name="date"]',
+        'meta[name="DC.date"]',
+        'meta[name="DC.Date"]',
+        'meta[property="og:published_time"]',
+        'meta[name="publishdate"]',
+        'meta[name="pub_date"]',
+        'meta[itemprop="datePublished"]',
+        'meta[itemprop="publishDate"]',
+    ]
+)
+TIME_DATE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in [
+        "time[datetime]",
+        "time[pubdate]",
+        ".published-date time",
+        ".publish-date time",
+        ".date time",
+    ]
+)
+ARTICLE_DATE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in [
+        ".published-date",
+        ".publish-date",
+        ".publication-date",
+        ".date-published",
+        ".article-date",
+        ".post-date",
+        ".entry-date",
+        ".timestamp",
+        '[class*="date"]',
+        '[class*="publish"]',
+    ]
+)
+
+# Dates found on earlier runs are reused for 30 days; errors are always refetched
+DATE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+CACHEABLE_STATUSES = frozenset({"success", "no_date_found"})
 
-        response = requests.get(url, headers=headers, timeout=30)
+
+def get_publication_date_from_url(url):
+    """Visit URL and extract publication date."""
+    try:
+        response = HTTP_SESSION.get(url, timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, HTML_PARSER)
 
         date = (
             find_date_in_meta_tags(soup)
@@ -54,24 +191,22 @@ def get_publication_date_from_url(url):
         return None, "error"
 
 
+def first_match(selector, candidates):
+    """Return the first candidate tag matched by a compiled selector, or None."""
+    for tag in candidates:
+        if selector.match(tag):
+            return tag
+    return None
+
+
 def find_date_in_meta_tags(soup):
-    meta_selectors = [
-        'meta[property="article:published_time"]',
-        'meta[property="article:published"]',
-        'meta[name="publish-date"]',
-        'meta[name="publication-date"]',
-        'meta[name="date"]',
-        'meta[name="DC.date"]',
-        'meta[name="DC.Date"]',
-        'meta[property="og:published_time"]',
-        'meta[name="publishdate"]',
-        'meta[name="pub_date"]',
-        'meta[itemprop="datePublished"]',
-        'meta[itemprop="publishDate"]',
-    ]
+    # One pass collects the meta tags; selectors are then tried in priority order
+    metas = soup.find_all("meta")
+    if not metas:
+        return None
 
-    for selector in meta_selectors:
-        meta = soup.select_one(selector)
+    for selector in META_DATE_SELECTORS:
+        meta = first_match(selector, metas)
         if not meta:
             continue
 
@@ -93,7 +228,11 @@ def find_date_in_json_ld(soup):
             if not script.string:
                 continue
 
-            data = json.loads(script.string)
+            text = str(script.string)
+            if not JSON_LD_DATE_FIELD_PATTERN.search(text):
+                continue
+
+            data = json_loads(text)
 
             if isinstance(data, list):
                 for item in data:
@@ -114,8 +253,7 @@ def extract_date_from_json_object(obj):
     if not isinstance(obj, dict):
         return None
 
-    date_fields = ["datePublished", "publishDate", "dateCreated", "uploadDate"]
-    for field in date_fields:
+    for field in JSON_LD_DATE_FIELDS:
         if field not in obj:
             continue
 
@@ -127,16 +265,12 @@ def extract_date_from_json_object(obj):
 
 
 def find_date_in_time_tags(soup):
-    time_selectors = [
-        "time[datetime]",
-        "time[pubdate]",
-        ".published-date time",
-        ".publish-date time",
-        ".date time",
-    ]
+    times = soup.find_all("time")
+    if not times:
+        return None
 
-    for selector in time_selectors:
-        time_elem = soup.select_one(selector)
+    for selector in TIME_DATE_SELECTORS:
+        time_elem = first_match(selector, times)
         if not time_elem:
             continue
 
@@ -156,21 +290,11 @@ def find_date_in_time_tags(soup):
 
 
 def find_date_in_article_tags(soup):
-    date_selectors = [
-        ".published-date",
-        ".publish-date",
-        ".publication-date",
-        ".date-published",
-        ".article-date",
-        ".post-date",
-        ".entry-date",
-        ".timestamp",
-        '[class*="date"]',
-        '[class*="publish"]',
-    ]
+    # Every selector here needs a class attribute, so only those tags are checked
+    classed = soup.find_all(class_=True)
 
-    for selector in date_selectors:
-        elements = soup.select(selector)
+    for selector in ARTICLE_DATE_SELECTORS:
+        elements = (elem for elem in classed if selector.match(elem))
         for elem in elements:
             text = elem.get_text().strip()
             if not text or len(text) >= 100:
@@ -184,54 +308,70 @@ def find_date_in_article_tags(soup):
 
 
 def find_date_in_text_patterns(soup):
-    text = soup.get_text()
-    patterns = [
-        r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
-        r"Publication Date:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
-        r"(\d{1,2}/\d{1,2}/\d{4})",
-        r"(\d{4}-\d{2}-\d{2})",
-        r"([A-Za-z]+ \d{1,2},? \d{4})",
-    ]
+    # Dates sit near the top of a page, so the head of the text is scanned
+    # first and the full text only when nothing is found there
+    text = page_text_head(soup, TEXT_PATTERN_SCAN_LIMIT)
+    parsed_date = find_date_in_text(text)
+    if parsed_date or len(text) < TEXT_PATTERN_SCAN_LIMIT:
+        return parsed_date
+
+    return find_date_in_text(soup.get_text())
 
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            parsed_date = parse_date_string(match)
+
+def find_date_in_text(text):
+    # finditer stops scanning at the first match that parses
+    for pattern in TEXT_DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            parsed_date = parse_date_string(match.group(1))
             if parsed_date:
                 return parsed_date
 
     return None
 
 
+def page_text_head(soup, limit):
+    """Return roughly the first `limit` characters of the page text"""
+    parts = []
+    size = 0
+    for string in soup.strings:
+        parts.append(string)
+        size += len(string)
+        if size >= limit:
+            break
+
+    return "".join(parts)[:limit]
+
+
 def parse_date_string(date_str):
     if not date_str:
         return None
 
-    date_str = str(date_str).strip()
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y/%m/%d",
-        "%B %d %Y",
-        "%b %d %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-    ]
+    return parse_date_text(str(date_str).strip())
+
 
-    for fmt in formats:
+@lru_cache(maxsize=4096)
+def parse_date_text(date_str):
+    """Parse a stripped date string to YYYY-MM-DD; cached as pages repeat dates."""
+    # Plain ISO dates are the most common case
+    if ISO_DAY_PATTERN.fullmatch(date_str):
         try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime("%Y-%m-%d")
+            return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
         except ValueError:
+            pass
+
+    # Only try the formats whose shape matches the string
+    for pattern, formats in DATE_FORMAT_DISPATCH:
+        if not pattern.fullmatch(date_str):
             continue
 
-    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_str)
+        for fmt in formats:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                return dt.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+
+    date_match = ISO_DATE_PATTERN.search(date_str)
     if date_match:
         return date_match.group(1)
 
@@ -246,8 +386,81 @@ def build_output_path(input_csv_path, output_csv_path=None):
     return f"{root}_dated{ext}"
 
 
-def apply_dates_to_csv(input_csv_path, output_csv_path=None, delay=2.0, in_place=False):
-    """Read URLs from column F and write publication dates to column D (note)."""
+def build_cache_path(input_csv_path):
+    """Keep the date cache next to the input CSV."""
+    root, _ = os.path.splitext(input_csv_path)
+    return f"{root}_date_cache.json"
+
+
+def load_date_cache(cache_path):
+    """Load dates found on earlier runs, keyed by URL, dropping expired entries."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable date cache {cache_path}: {e}")
+        return {}
+
+    cutoff = time.time() - DATE_CACHE_MAX_AGE
+    return {
+        url: entry
+        for url, entry in cache.items()
+        if entry.get("fetched_at", 0) >= cutoff
+    }
+
+
+def save_date_cache(cache, cache_path):
+    """Write found dates so later runs can skip refetching."""
+    if not cache_path:
+        return
+
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=1)
+
+
+def fetch_publication_dates(urls, delay=2.0, max_workers=8):
+    """Fetch publication dates for (index, url) pairs, returning {index: (date, status)}.
+
+    Different hosts are fetched in parallel while each host still sees one
+    request at a time, with `delay` seconds between its requests.
+    """
+    total = len(urls)
+    progress = count(1)
+    results = {}
+
+    urls_by_host = defaultdict(list)
+    for index, url in urls:
+        urls_by_host[urlparse(url).netloc].append((index, url))
+
+    def process_host_urls(host_urls):
+        for position, (index, url) in enumerate(host_urls):
+            if position:
+                time.sleep(delay)
+            logger.info(f"Processing {next(progress)}/{total}: {url[:90]}")
+            results[index] = get_publication_date_from_url(url)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(process_host_urls, urls_by_host.values()))
+
+    return results
+
+
+def apply_dates_to_csv(
+    input_csv_path,
+    output_csv_path=None,
+    delay=2.0,
+    in_place=False,
+    max_workers=8,
+    cache_path=None,
+):
+    """Read URLs from column F and write publication dates to column D (note).
+
+    When `cache_path` is given, dates found on earlier runs are read from and
+    saved to that JSON file instead of refetching their URLs.
+    """
     if not os.path.exists(input_csv_path):
         raise FileNotFoundError(f"Input CSV not found: {input_csv_path}")
 
@@ -261,42 +474,61 @@ def apply_dates_to_csv(input_csv_path, output_csv_path=None, delay=2.0, in_place
     url_col = df.columns[5]  # Column F
     status_col = "date_status"
 
-    df[note_col] = df[note_col].astype("object")
-    df[status_col] = "no_url"
-
     logger.info(f"Using column F for URLs: {url_col}")
     logger.info(f"Writing publication dates to column D: {note_col}")
     logger.info(f"Writing processing status to column: {status_col}")
 
     total_urls = int(df[url_col].notna().sum())
-    processed = 0
     success = 0
 
-    for index, url in df[url_col].items():
+    # Results are collected in plain lists and written back as whole columns
+    notes = df[note_col].tolist()
+    statuses = ["no_url"] * len(df)
+
+    urls = []
+    for position, url in enumerate(df[url_col].tolist()):
         if pd.isna(url):
-            df.at[index, status_col] = "no_url"
             continue
 
         url_text = str(url).strip()
-        if not url_text:
-            df.at[index, status_col] = "no_url"
-            continue
-
-        processed += 1
-        logger.info(f"Processing {processed}/{total_urls}: {url_text[:90]}")
-
-        date_str, status = get_publication_date_from_url(url_text)
-        df.at[index, status_col] = status
+        if url_text:
+            urls.append((position, url_text))
+
+    processed = len(urls)
+    date_cache = load_date_cache(cache_path)
+    results = {
+        position: (date_cache[url]["date"], date_cache[url]["status"])
+        for position, url in urls
+        if url in date_cache
+    }
+    if results:
+        logger.info(f"Using cached dates for {len(results)} URLs")
+
+    to_fetch = [(position, url) for position, url in urls if position not in results]
+    fetched = fetch_publication_dates(to_fetch, delay=delay, max_workers=max_workers)
+    results.update(fetched)
+
+    if cache_path:
+        now = time.time()
+        for position, url in to_fetch:
+            date_str, status = fetched[position]
+            if status in CACHEABLE_STATUSES:
+                date_cache[url] = {"date": date_str, "status": status, "fetched_at": now}
+        save_date_cache(date_cache, cache_path)
+
+    for position, _ in urls:
+        date_str, status = results[position]
+        statuses[position] = status
         if status == "success" and date_str:
-            existing_note = df.at[index, note_col]
+            existing_note = notes[position]
             if pd.isna(existing_note) or str(existing_note).strip() == "":
-                df.at[index, note_col] = date_str
+                notes[position] = date_str
             else:
-                df.at[index, note_col] = f"{existing_note} | publication_date: {date_str}"
+                notes[position] = f"{existing_note} | publication_date: {date_str}"
             success += 1
 
-        if processed < total_urls:
-            time.sleep(delay)
+    df[note_col] = notes
+    df[status_col] = statuses
 
     final_output = input_csv_path if in_place else build_output_path(input_csv_path, output_csv_path)
     logger.info(f"Saving updated CSV: {final_output}")
@@ -331,7 +563,24 @@ def parse_args():
         "--delay",
         type=float,
         default=2.0,
-        help="Delay in seconds between URL requests.",
+        help="Delay in seconds between URL requests to the same host.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of hosts to fetch from in parallel.",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        default=None,
+        help="Path to the date cache. Default adds _date_cache.json to input filename.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every URL instead of reusing dates found on earlier runs.",
     )
     parser.add_argument(
         "--in-place",
@@ -348,6 +597,8 @@ def main():
         output_csv_path=args.output_csv,
         delay=args.delay,
         in_place=args.in_place,
+        max_workers=args.workers,
+        cache_path=None if args.no_cache else args.cache_path or build_cache_path(args.input_csv),
     )
     print(f"Updated CSV saved to: {os.path.abspath(output_path)}")
 
@@ -1,10 +1,24 @@
 import csv
+import json
+import os
 import requests
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 INPUT_FILE = "Source files/raindrop_export_2026_02_14/export.csv"
 OUTPUT_FILE = "Source files/raindrop_export_2026_02_14/export_expanded.csv"
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Redirects resolved on earlier runs are reused for 30 days; set to None to disable
+CACHE_FILE = "Source files/raindrop_export_2026_02_14/export_redirect_cache.json"
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# Save the cache after this many new redirects so an interrupted run can resume
+CACHE_SAVE_EVERY = 100
 
 # Set to True if you ONLY want to expand flip.it links
 ONLY_EXPAND_FLIP = True
@@ -12,6 +26,25 @@ ONLY_EXPAND_FLIP = True
 # Timeout in seconds for each request
 REQUEST_TIMEOUT = 10
 
+# Seconds between requests to the same host, and how many hosts run at once
+REQUEST_DELAY = 0.5
+MAX_WORKERS = 8
+
+def build_http_session():
+    """Shared session so connections are kept alive and reused per host"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+HTTP_SESSION = build_http_session()
+
 def is_flip_url(url):
     try:
         parsed = urlparse(url)
@@ -21,49 +54,143 @@ def is_flip_url(url):
 
 def resolve_url(url):
     try:
-        response = requests.get(
+        # HEAD follows the redirect chain without downloading the page
+        with HTTP_SESSION.head(
             url,
             timeout=REQUEST_TIMEOUT,
             allow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0"}
-        )
-        return response.url
+        ) as response:
+            if response.status_code != 405:
+                return response.url
+
+        # Some servers refuse HEAD; stream the GET and close it unread
+        with HTTP_SESSION.get(
+            url,
+            timeout=REQUEST_TIMEOUT,
+            allow_redirects=True,
+            stream=True,
+        ) as response:
+            return response.url
     except Exception as e:
         print(f"Error resolving {url}: {e}")
         return url  # return original if failure
 
+def load_redirect_cache(cache_path):
+    """Load redirects resolved on earlier runs, keyed by URL, dropping expired entries."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable redirect cache {cache_path}: {e}")
+        return {}
+
+    cutoff = time.time() - CACHE_MAX_AGE
+    return {
+        url: entry
+        for url, entry in cache.items()
+        if entry.get("fetched_at", 0) >= cutoff
+    }
+
+def save_redirect_cache(cache, cache_path):
+    """Write resolved redirects so later runs can skip them."""
+    if not cache_path:
+        return
+
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=1)
+
+def resolve_urls(urls, delay=REQUEST_DELAY, max_workers=MAX_WORKERS, cache_path=None):
+    """Resolve (row number, url) pairs, returning {row number: final url}.
+
+    Different hosts are resolved in parallel while each host still sees one
+    request at a time, with `delay` seconds between its requests. When
+    `cache_path` is given, URLs that redirected on an earlier run are read
+    from that JSON file instead of being requested again. Failures and URLs
+    that did not redirect are not cached, so they are retried next run.
+    """
+    cache = load_redirect_cache(cache_path)
+    cache_lock = threading.Lock()
+    new_entries = 0
+
+    # Each distinct URL is resolved once, however many rows share it
+    final_urls = {}
+    urls_by_host = defaultdict(list)
+    seen = set()
+    for i, url in urls:
+        if url in seen:
+            continue
+        seen.add(url)
+        if url in cache:
+            final_urls[url] = cache[url]["url"]
+        else:
+            urls_by_host[urlparse(url).netloc].append((i, url))
+
+    if final_urls:
+        print(f"Using cached redirects for {len(final_urls)} URLs")
+
+    def resolve_host_urls(host_urls):
+        nonlocal new_entries
+        for position, (i, url) in enumerate(host_urls):
+            # Be polite — avoid hammering servers
+            if position:
+                time.sleep(delay)
+            print(f"[{i}] Resolving: {url}")
+            final_urls[url] = final_url = resolve_url(url)
+
+            if cache_path and final_url != url:
+                with cache_lock:
+                    cache[url] = {"url": final_url, "fetched_at": time.time()}
+                    new_entries += 1
+                    if new_entries % CACHE_SAVE_EVERY == 0:
+                        save_redirect_cache(cache, cache_path)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(resolve_host_urls, urls_by_host.values()))
+    finally:
+        if new_entries:
+            with cache_lock:
+                save_redirect_cache(cache, cache_path)
+
+    return {i: final_urls[url] for i, url in urls}
+
 def main():
     with open(INPUT_FILE, newline='', encoding='utf-8') as infile:
         reader = csv.DictReader(infile)
         fieldnames = reader.fieldnames
+        rows = list(reader)
 
-        with open(OUTPUT_FILE, "w", newline='', encoding='utf-8') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for i, row in enumerate(reader, start=1):
-                original_url = row.get("url") or row.get("URL") or row.get("Url")
+    # Pick out the URLs to resolve, keyed by 1-based row number
+    to_resolve = []
+    for i, row in enumerate(rows, start=1):
+        original_url = row.get("url") or row.get("URL") or row.get("Url")
 
-                if not original_url:
-                    writer.writerow(row)
-                    continue
+        if not original_url:
+            continue
 
-                if ONLY_EXPAND_FLIP and not is_flip_url(original_url):
-                    writer.writerow(row)
-                    continue
+        if ONLY_EXPAND_FLIP and not is_flip_url(original_url):
+            continue
 
-                print(f"[{i}] Resolving: {original_url}")
+        to_resolve.append((i, original_url))
 
-                final_url = resolve_url(original_url)
+    resolved = resolve_urls(to_resolve, cache_path=CACHE_FILE)
 
-                if final_url != original_url:
-                    print(f"    → {final_url}")
-                    row["url"] = final_url
+    for i, row in enumerate(rows, start=1):
+        original_url = row.get("url") or row.get("URL") or row.get("Url")
+        final_url = resolved.get(i, original_url)
 
-                writer.writerow(row)
+        if final_url != original_url:
+            print(f"[{i}] {original_url} → {final_url}")
+            row["url"] = final_url
 
-                # Be polite — avoid hammering servers
-                time.sleep(0.5)
+    # Written in one call through a 1 MB buffer
+    with open(OUTPUT_FILE, "w", newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
 
     print("\nDone. Output written to:", OUTPUT_FILE)
 
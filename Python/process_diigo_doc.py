@@ -1,29 +1,60 @@
+import logging
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
+from docx.oxml.ns import qn
 import re
+from collections import defaultdict
 from difflib import SequenceMatcher
 import openpyxl
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, PatternFill, Alignment
 
+# How every paragraph is classified is logged at DEBUG level
+logger = logging.getLogger(__name__)
+
+# Print a progress line after every this many paragraphs
+PROGRESS_EVERY = 500
+
+# Precompiled patterns
+ARTICLE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}):\s*(.*)")
+ARTICLE_PREFIX_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}:")
+MAIN_CATEGORY_PATTERN = re.compile(r"^[A-Z][a-z].*")
+
+# CSV columns used for matching; created_at is optional
+CSV_COLUMNS = ["title", "url", "created_at"]
+
+# Word XML tags used when reading paragraphs directly
+W_HYPERLINK = qn("w:hyperlink")
+W_OUTLINE_LVL = qn("w:outlineLvl")
+W_NUM_PR = qn("w:numPr")
+W_ILVL = qn("w:ilvl")
+W_VAL = qn("w:val")
+R_ID = qn("r:id")
+
 
 def extract_all_articles_from_docx(docx_path):
     """
     More comprehensive extraction that catches all article entries
     """
     doc = Document(docx_path)
+    rels = doc.part.rels  # shared by every body paragraph
     outline_data = []
     current_hierarchy = ["", "", "", ""]  # Main, Sub1, Sub2, Sub3
 
     print("Analyzing document structure...")
 
     for para_idx, paragraph in enumerate(doc.paragraphs):
+        if para_idx and para_idx % PROGRESS_EVERY == 0:
+            print(f"  {para_idx} paragraphs read, {len(outline_data)} articles so far")
+
         text = paragraph.text.strip()
 
         if not text:
             continue
 
-        print(f"Para {para_idx}: Level ? - '{text[:80]}...'")
+        logger.debug("Para %d: Level ? - '%s...'", para_idx, text[:80])
 
         # Get the actual outline level from Word
         level = get_word_outline_level(paragraph)
@@ -32,10 +63,10 @@ def extract_all_articles_from_docx(docx_path):
         if level is None:
             level = analyze_text_pattern(text)
 
-        print(f"  -> Determined level: {level}")
+        logger.debug("  -> Determined level: %s", level)
 
         # Check if this looks like an article entry (has date pattern)
-        date_match = re.search(r"(\d{4}-\d{2}-\d{2}):\s*(.*)", text)
+        date_match = ARTICLE_PATTERN.search(text)
 
         if date_match:
             # This is an article entry
@@ -43,7 +74,7 @@ def extract_all_articles_from_docx(docx_path):
             title = date_match.group(2).strip()
 
             # Extract hyperlink if present
-            hyperlink_url = extract_hyperlink_from_paragraph(paragraph)
+            hyperlink_url = extract_hyperlink_from_paragraph(paragraph, rels)
 
             # Clean up hierarchy for this article
             current_clean_hierarchy = [h for h in current_hierarchy if h]
@@ -71,7 +102,7 @@ def extract_all_articles_from_docx(docx_path):
                     "raw_text": text,
                 }
             )
-            print(f"  -> ARTICLE FOUND: {title[:50]}...")
+            logger.debug("  -> ARTICLE FOUND: %s...", title[:50])
 
         else:
             # This is a category/subcategory header
@@ -87,8 +118,8 @@ def extract_all_articles_from_docx(docx_path):
                 if level < len(current_hierarchy):
                     current_hierarchy[level] = clean_text
 
-                print(f"  -> CATEGORY: Level {level} = '{clean_text}'")
-                print(f"  -> Current hierarchy: {current_hierarchy}")
+                logger.debug("  -> CATEGORY: Level %s = '%s'", level, clean_text)
+                logger.debug("  -> Current hierarchy: %s", current_hierarchy)
 
     print(f"\nTotal articles found: {len(outline_data)}")
     return outline_data
@@ -100,37 +131,23 @@ def get_word_outline_level(paragraph):
     """
     try:
         # Check for outline level in paragraph properties
-        if paragraph._element.pPr is not None:
-            outline_lvl = paragraph._element.pPr.find(
-                ".//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}outlineLvl"
-            )
+        pPr = paragraph._element.pPr
+        if pPr is not None:
+            outline_lvl = next(pPr.iter(W_OUTLINE_LVL), None)
             if outline_lvl is not None:
-                return int(
-                    outline_lvl.get(
-                        "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val",
-                        0,
-                    )
-                )
+                return int(outline_lvl.get(W_VAL, 0))
 
             # Check for numbering properties
-            numPr = paragraph._element.pPr.find(
-                ".//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numPr"
-            )
+            numPr = next(pPr.iter(W_NUM_PR), None)
             if numPr is not None:
-                ilvl = numPr.find(
-                    ".//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ilvl"
-                )
+                ilvl = next(numPr.iter(W_ILVL), None)
                 if ilvl is not None:
-                    return int(
-                        ilvl.get(
-                            "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val",
-                            0,
-                        )
-                    )
+                    return int(ilvl.get(W_VAL, 0))
 
         # Check style-based outline level
-        if paragraph.style.name.startswith("Heading"):
-            return int(paragraph.style.name.replace("Heading ", "")) - 1
+        style_name = paragraph.style.name
+        if style_name.startswith("Heading"):
+            return int(style_name.replace("Heading ", "")) - 1
 
     except Exception as e:
         print(f"Error getting outline level: {e}")
@@ -146,7 +163,7 @@ def analyze_text_pattern(text):
     leading_spaces = len(text) - len(text.lstrip(" "))
 
     # Different patterns for different levels
-    if re.match(r"^[A-Z][a-z].*", text.strip()) and leading_spaces == 0:
+    if MAIN_CATEGORY_PATTERN.match(text.strip()) and leading_spaces == 0:
         # Looks like main category (starts with capital, no indentation)
         return 0
     elif text.strip().startswith("-") and leading_spaces <= 4:
@@ -158,7 +175,7 @@ def analyze_text_pattern(text):
     elif text.strip().startswith("-") and leading_spaces > 8:
         # Third level bullet
         return 3
-    elif re.match(r"\d{4}-\d{2}-\d{2}:", text):
+    elif ARTICLE_PREFIX_PATTERN.match(text):
         # Article entry - don't change hierarchy
         return None
     else:
@@ -169,39 +186,21 @@ def analyze_text_pattern(text):
             return 1
 
 
-def extract_hyperlink_from_paragraph(paragraph):
+def extract_hyperlink_from_paragraph(paragraph, rels=None):
     """
     Extract hyperlink URL from paragraph
+
+    Pass the document's `rels` when calling this for many paragraphs.
     """
     try:
-        # Look for hyperlinks in runs
-        for run in paragraph.runs:
-            if run._element.rPr is not None:
-                for elem in run._element.iter():
-                    if "hyperlink" in str(elem.tag).lower():
-                        # Try to get the relationship ID
-                        r_id = elem.get(
-                            "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
-                        )
-                        if (
-                            r_id
-                            and hasattr(paragraph.part, "rels")
-                            and r_id in paragraph.part.rels
-                        ):
-                            return paragraph.part.rels[r_id].target_ref
-
-        # Alternative method: look for hyperlink elements directly
-        for elem in paragraph._element.iter():
-            if "hyperlink" in str(elem.tag).lower():
-                r_id = elem.get(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
-                )
-                if (
-                    r_id
-                    and hasattr(paragraph.part, "rels")
-                    and r_id in paragraph.part.rels
-                ):
-                    return paragraph.part.rels[r_id].target_ref
+        if rels is None:
+            rels = paragraph.part.rels
+
+        # Hyperlinks wrap runs, so they are found on the paragraph element
+        for hyperlink in paragraph._element.iter(W_HYPERLINK):
+            r_id = hyperlink.get(R_ID)
+            if r_id and r_id in rels:
+                return rels[r_id].target_ref
 
     except Exception as e:
         print(f"Error extracting hyperlink: {e}")
@@ -214,50 +213,145 @@ def similarity_score(a, b):
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def match_urls_from_csv(outline_data, csv_path):
-    """Match outline items with URLs from CSV file"""
-    print(f"Loading CSV data from {csv_path}...")
-    df = pd.read_csv(csv_path)
-    print(f"CSV contains {len(df)} entries")
+def build_csv_index(df):
+    """Read the CSV columns used for matching into plain lists once"""
+    # Titles are lowercased here rather than on every comparison
+    titles = [str(title) for title in df["title"]]
+    if "created_at" in df.columns:
+        # Extract YYYY-MM-DD
+        dates = [
+            str(created)[:10] if pd.notna(created) else None
+            for created in df["created_at"]
+        ]
+    else:
+        dates = [None] * len(df)
+
+    # Skip CSV rows whose title is empty
+    candidates = [j for j, title in enumerate(titles) if title.strip()]
+
+    # Candidate rows by YYYY-MM-DD, in CSV order
+    candidates_by_date = defaultdict(list)
+    for j in candidates:
+        if dates[j] is not None:
+            candidates_by_date[dates[j]].append(j)
+
+    return {
+        "titles": titles,
+        "titles_lower": [title.lower() for title in titles],
+        "urls": df["url"].tolist(),
+        "dates": dates,
+        "candidates": candidates,
+        "candidates_by_date": candidates_by_date,
+    }
+
+
+def find_best_csv_match(outline_title, outline_date, csv_index):
+    """Return (best score, CSV row position or None) for one outline item"""
+    titles_lower = csv_index["titles_lower"]
+    dates = csv_index["dates"]
+
+    best_score = 0
+    best_j = None
+
+    # The matcher analyses the outline title once and is reused for
+    # every CSV title; this gives the same ratio as similarity_score
+    matcher = SequenceMatcher(None, "", outline_title.lower())
+
+    # Score the same-day rows first: with the 0.3 date bonus, a total
+    # above 1.0 cannot be beaten by a row from another day (ratio <= 1.0),
+    # so the rest of the CSV only needs searching when none gets there
+    same_day = csv_index["candidates_by_date"].get(outline_date, [])
+    same_day_scores = {}
+    for j in same_day:
+        matcher.set_seq1(titles_lower[j])
+        same_day_scores[j] = matcher.ratio()
+    # best_possible is the highest total any searched row can reach
+    if same_day_scores and max(same_day_scores.values()) + 0.3 > 1.0:
+        rows_to_search = same_day
+        best_possible = 1.0 + 0.3
+    else:
+        rows_to_search = csv_index["candidates"]
+        best_possible = 1.0
+
+    # Search through CSV for best title match
+    for j in rows_to_search:
+        # Bonus for date match
+        date_bonus = 0
+        if dates[j] == outline_date:
+            date_bonus = 0.3
+
+        # Calculate similarity score
+        score = same_day_scores.get(j)
+        if score is None:
+            matcher.set_seq1(titles_lower[j])
+            # Both quick ratios are upper bounds on ratio(); skip the full
+            # comparison when even the bound cannot beat the best so far
+            if matcher.real_quick_ratio() + date_bonus <= best_score:
+                continue
+            if matcher.quick_ratio() + date_bonus <= best_score:
+                continue
+            score = matcher.ratio()
 
-    matched_count = 0
+        total_score = score + date_bonus
 
-    for i, item in enumerate(outline_data):
-        if i % 50 == 0:
-            print(f"Processing item {i+1}/{len(outline_data)}")
+        if total_score > best_score:
+            best_score = total_score
+            best_j = j
 
-        best_match = None
-        best_score = 0
-        best_url = None
-        best_csv_title = None
+            # A perfect match cannot be beaten by any later row
+            if best_score >= best_possible:
+                break
 
-        outline_title = item["title"]
+    return best_score, best_j
 
-        # Search through CSV for best title match
-        for _, row in df.iterrows():
-            csv_title = str(row["title"])
 
-            # Skip if CSV title is NaN or empty
-            if pd.isna(csv_title) or not csv_title.strip():
-                continue
+# CSV index handed to each worker process once, by the pool initializer
+_worker_csv_index = None
+
+
+def _init_match_worker(csv_index):
+    global _worker_csv_index
+    _worker_csv_index = csv_index
+
+
+def _find_best_csv_match_in_worker(key):
+    outline_title, outline_date = key
+    return find_best_csv_match(outline_title, outline_date, _worker_csv_index)
+
+
+def match_urls_from_csv(outline_data, csv_path, workers=None):
+    """Match outline items with URLs from CSV file
 
-            # Calculate similarity score
-            score = similarity_score(csv_title, outline_title)
+    Set workers > 1 to match outline items in that many processes.
+    """
+    print(f"Loading CSV data from {csv_path}...")
+    df = pd.read_csv(csv_path, usecols=lambda col: col in CSV_COLUMNS)
+    print(f"CSV contains {len(df)} entries")
 
-            # Bonus for date match
-            date_bonus = 0
-            if "created_at" in row and pd.notna(row["created_at"]):
-                csv_date = str(row["created_at"])[:10]  # Extract YYYY-MM-DD
-                if csv_date == item["date"]:
-                    date_bonus = 0.3
+    csv_index = build_csv_index(df)
+    keys = [(item["title"], item["date"]) for item in outline_data]
+
+    if workers and workers > 1:
+        chunksize = max(1, len(keys) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_match_worker,
+            initargs=(csv_index,),
+        ) as executor:
+            matches = list(
+                executor.map(_find_best_csv_match_in_worker, keys, chunksize=chunksize)
+            )
+    else:
+        matches = [find_best_csv_match(title, date, csv_index) for title, date in keys]
 
-            total_score = score + date_bonus
+    matched_count = 0
 
-            if total_score > best_score:
-                best_score = total_score
-                best_match = csv_title
-                best_url = row["url"]
-                best_csv_title = csv_title
+    for i, (item, (best_score, best_j)) in enumerate(zip(outline_data, matches)):
+        if i % 50 == 0:
+            print(f"Processing item {i+1}/{len(outline_data)}")
+
+        best_match = csv_index["titles"][best_j] if best_j is not None else None
+        best_url = csv_index["urls"][best_j] if best_j is not None else None
 
         # Add match results
         item["matched_title"] = best_match
@@ -276,13 +370,9 @@ def match_urls_from_csv(outline_data, csv_path):
 
 def create_excel_file(outline_data, output_path):
     """Create Excel file with outline structure and hyperlinks"""
-    # Create DataFrame
-    df = pd.DataFrame(outline_data)
-
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Research Outline"
+    # Create a write-only workbook, which streams rows straight to the file
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Research Outline")
 
     # Headers
     headers = [
@@ -299,64 +389,75 @@ def create_excel_file(outline_data, output_path):
     ]
 
     # Add headers with formatting
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(
+        start_color="366092", end_color="366092", fill_type="solid"
+    )
+    header_row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        header_row.append(cell)
+
+    # Build the data rows, tracking each column's widest value as we go
+    link_font = Font(color="0563C1", underline="single")
+    max_lengths = [len(header) for header in headers]
+    rows = []
+    for item in outline_data:
+        # Source
+        source = (
+            "CSV Match"
+            if item["csv_url"]
+            else "Doc Link" if item["doc_hyperlink"] else "No Link"
         )
-
-    # Add data
-    for row_idx, item in enumerate(outline_data, 2):
-        ws.cell(row=row_idx, column=1, value=item["main_category"])
-        ws.cell(row=row_idx, column=2, value=item["subcategory_1"])
-        ws.cell(row=row_idx, column=3, value=item["subcategory_2"])
-        ws.cell(row=row_idx, column=4, value=item["subcategory_3"])
-        ws.cell(row=row_idx, column=5, value=item["date"])
+        values = [
+            item["main_category"],
+            item["subcategory_1"],
+            item["subcategory_2"],
+            item["subcategory_3"],
+            item["date"],
+            item["title"],
+            item["final_url"] or "",
+            round(item.get("match_score", 0), 3),
+            source,
+            item["full_hierarchy"],
+        ]
+        for c, value in enumerate(values):
+            max_lengths[c] = max(max_lengths[c], len(str(value)))
 
         # Create hyperlinked title
-        title_cell = ws.cell(row=row_idx, column=6, value=item["title"])
         if item["final_url"]:
+            title_cell = WriteOnlyCell(ws, value=item["title"])
             title_cell.hyperlink = item["final_url"]
-            title_cell.font = Font(color="0563C1", underline="single")
+            title_cell.font = link_font
+            values[5] = title_cell
 
-        ws.cell(row=row_idx, column=7, value=item["final_url"] or "")
-        ws.cell(row=row_idx, column=8, value=round(item.get("match_score", 0), 3))
+        rows.append(values)
 
-        # Source
-        source = (
-            "CSV Match"
-            if item["csv_url"]
-            else "Doc Link" if item["doc_hyperlink"] else "No Link"
-        )
-        ws.cell(row=row_idx, column=9, value=source)
-        ws.cell(row=row_idx, column=10, value=item["full_hierarchy"])
-
-    # Auto-adjust columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 60)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    # Column widths have to be set before the first row is written
+    for c, max_length in enumerate(max_lengths, 1):
+        ws.column_dimensions[get_column_letter(c)].width = min(max_length + 2, 60)
+
+    ws.append(header_row)
+    for values in rows:
+        ws.append(values)
 
     wb.save(output_path)
     print(f"Excel file saved to: {output_path}")
 
 
-def main(docx_path, csv_path, output_path):
-    """Main function"""
+def main(docx_path, csv_path, output_path, workers=None):
+    """Main function
+
+    Set workers > 1 to match titles against the CSV in that many processes.
+    """
 
     print("Step 1: Extracting ALL articles from Word document...")
     outline_data = extract_all_articles_from_docx(docx_path)
 
     print("Step 2: Matching with CSV data...")
-    matched_data = match_urls_from_csv(outline_data, csv_path)
+    matched_data = match_urls_from_csv(outline_data, csv_path, workers=workers)
 
     print("Step 3: Creating Excel file...")
     create_excel_file(matched_data, output_path)
@@ -1,21 +1,41 @@
 import argparse
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 import webbrowser
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
 from urllib.parse import urlparse
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, UnicodeDammit
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+
+    def json_loads(text):
+        """Decode with orjson, retrying with json for input only it accepts (NaN, lone surrogates)"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+except Exception:
+    json_loads = json.loads
+
 try:
     import trafilatura
 except Exception:
@@ -26,11 +46,73 @@ try:
 except Exception:
     browser_cookie3 = None
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
+
 from docx import Document
+from docx.oxml.ns import nsmap
+from lxml import etree
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+WORD_PATTERN = re.compile(r"\b[\w'-]+\b")
+ISO_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+UNSAFE_FILENAME_PATTERN = re.compile(r"[^a-zA-Z0-9._-]+")
+
+# Only pages of these content types are downloaded and parsed, up to MAX_PAGE_BYTES
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+STREAM_CHUNK_SIZE = 65536
+
+# Results of fetched pages are reused for a week; failed fetches are always retried
+TAG_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+CACHED_FIELDS = ("pub_date", "date_status", "wordcount", "wc_status", "wc_method")
+# HTML of successfully fetched pages is re-extracted instead of refetched for a week
+PAGE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Each pattern accepts every string its formats can parse, so a string
+# is only handed to strptime with formats that can actually match it
+DATE_FORMAT_DISPATCH = tuple(
+    (re.compile(pattern, re.IGNORECASE), formats)
+    for pattern, formats in [
+        (r"\d{4}-\d{1,2}- ?\d{1,2}", ("%Y-%m-%d",)),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}",
+            ("%Y-%m-%dT%H:%M:%S",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}Z",
+            ("%Y-%m-%dT%H:%M:%SZ",),
+        ),
+        (
+            r"\d{4}-\d{1,2}- ?\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}\.\d{1,6}Z",
+            ("%Y-%m-%dT%H:%M:%S.%fZ",),
+        ),
+        (r"[a-z]+\s+ ?\d{1,2},\s*\d{4}", ("%B %d, %Y", "%b %d, %Y")),
+        (r" ?\d{1,2}/ ?\d{1,2}/\d{4}", ("%m/%d/%Y", "%d/%m/%Y")),
+        (r"\d{4}/\d{1,2}/ ?\d{1,2}", ("%Y/%m/%d",)),
+        (r"[a-z]+\s+ ?\d{1,2}\s+\d{4}", ("%B %d %Y", "%b %d %Y")),
+        (r" ?\d{1,2}\s+[a-z]+\s+\d{4}", ("%d %B %Y", "%d %b %Y")),
+    ]
+)
+ISO_DAY_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Date patterns searched in page text, compiled once and tried in order
+TEXT_DATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})",
+        r"(\d{1,2}/\d{1,2}/\d{4})",
+        r"(\d{4}-\d{2}-\d{2})",
+        r"([A-Za-z]+ \d{1,2},? \d{4})",
+    ]
+)
+
 
 def build_http_session():
     session = requests.Session()
@@ -43,7 +125,8 @@ def build_http_session():
         allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    # Enough kept-alive connections per host for every worker thread
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
@@ -77,49 +160,83 @@ def get_browser_cookie_jar(browser_name, url):
 def normalize_text(text):
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() splits on exactly the characters \s matches, without a regex pass
+    return " ".join(text.split())
 
 
 def count_words(text):
-    words = re.findall(r"\b[\w'-]+\b", text)
-    return len(words)
+    return len(WORD_PATTERN.findall(text))
 
 
 def parse_date_string(date_str):
     if not date_str:
         return None
-    date_str = str(date_str).strip()
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y/%m/%d",
-        "%B %d %Y",
-        "%b %d %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-    ]
-    for fmt in formats:
+    return parse_date_text(str(date_str).strip())
+
+
+@lru_cache(maxsize=4096)
+def parse_date_text(date_str):
+    """Parse a stripped date string to YYYY-MM-DD; cached as pages repeat dates."""
+    # Plain ISO dates are the most common case
+    if ISO_DAY_PATTERN.fullmatch(date_str):
         try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime("%Y-%m-%d")
+            return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
         except ValueError:
+            pass
+
+    # Only try the formats whose shape matches the string
+    for pattern, formats in DATE_FORMAT_DISPATCH:
+        if not pattern.fullmatch(date_str):
             continue
-    m = re.search(r"(\d{4}-\d{2}-\d{2})", date_str)
+
+        for fmt in formats:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                return dt.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+
+    m = ISO_DATE_PATTERN.search(date_str)
     if m:
         return m.group(1)
     return None
 
 
-def extract_json_ld_article_text(html_text):
+# Decoded JSON-LD scripts keyed by a digest of their text, since publishers
+# repeat the same blocks on every page; the oldest entry is dropped when full
+JSONLD_CACHE_SIZE = 1024
+JSONLD_CACHE = {}
+JSONLD_CACHE_LOCK = threading.Lock()
+
+
+def decode_jsonld(text):
+    """Return a script's decoded JSON as a one-item tuple, or () if it is not valid JSON."""
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with JSONLD_CACHE_LOCK:
+        decoded = JSONLD_CACHE.get(key)
+    if decoded is None:
+        try:
+            decoded = (json_loads(text),)
+        except Exception:
+            decoded = ()
+        with JSONLD_CACHE_LOCK:
+            if len(JSONLD_CACHE) >= JSONLD_CACHE_SIZE:
+                del JSONLD_CACHE[next(iter(JSONLD_CACHE))]
+            JSONLD_CACHE[key] = decoded
+    return decoded
+
+
+def parse_jsonld(soup):
+    """Decode every JSON-LD script on the page once, skipping invalid ones."""
+    items = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        if script.string:
+            items.extend(decode_jsonld(str(script.string)))
+    return items
+
+
+def extract_json_ld_article_text(jsonld):
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
-        scripts = soup.find_all("script", type="application/ld+json")
         candidates = []
 
         def collect_texts(obj):
@@ -135,13 +252,7 @@ def extract_json_ld_article_text(html_text):
                 for item in obj:
                     collect_texts(item)
 
-        for script in scripts:
-            if not script.string:
-                continue
-            try:
-                data = json.loads(script.string)
-            except Exception:
-                continue
+        for data in jsonld:
             collect_texts(data)
 
         if not candidates:
@@ -152,14 +263,21 @@ def extract_json_ld_article_text(html_text):
         return "", "jsonld_failed"
 
 
-BOILERPLATE_CLASS_ID_PATTERN = re.compile(
-    r"(^|[-_\s])(ad|ads|advert|advertisement|sponsor|promo|related|newsletter|"
-    r"footer|sidebar|share|social|cookie|banner|recommend|trending|outbrain|"
-    r"taboola)($|[-_\s])",
-    re.IGNORECASE,
+# A class/id marks boilerplate when any of its -, _ or whitespace separated words is one of these
+BOILERPLATE_CLASS_ID_TOKENS = frozenset(
+    [
+        "ad", "ads", "advert", "advertisement", "sponsor", "promo", "related", "newsletter",
+        "footer", "sidebar", "share", "social", "cookie", "banner", "recommend", "trending",
+        "outbrain", "taboola",
+    ]
 )
 
 
+def is_boilerplate_marker(marker):
+    words = marker.casefold().replace("-", " ").replace("_", " ").split()
+    return not BOILERPLATE_CLASS_ID_TOKENS.isdisjoint(words)
+
+
 def extract_main_text_with_bs4(soup):
     for tag in soup(["script", "style", "noscript", "svg", "iframe"]):
         tag.decompose()
@@ -168,7 +286,7 @@ def extract_main_text_with_bs4(soup):
         class_attr = " ".join(node.get("class", []))
         id_attr = node.get("id", "")
         marker = f"{class_attr} {id_attr}".strip()
-        if marker and BOILERPLATE_CLASS_ID_PATTERN.search(marker):
+        if marker and is_boilerplate_marker(marker):
             nodes_to_remove.append(node)
     for node in nodes_to_remove:
         node.decompose()
@@ -196,24 +314,55 @@ def extract_main_text_with_trafilatura(html_text):
     return "", "trafilatura_failed"
 
 
-def get_pub_date_from_soup(soup):
-    # try meta tags
-    meta_selectors = [
-        'meta[property="article:published_time"]',
-        'meta[property="article:published"]',
-        'meta[name="publish-date"]',
-        'meta[name="publication-date"]',
-        'meta[name="date"]',
-        'meta[name="DC.date"]',
-        'meta[name="DC.Date"]',
-        'meta[property="og:published_time"]',
-        'meta[name="publishdate"]',
-        'meta[name="pub_date"]',
-        'meta[itemprop="datePublished"]',
-        'meta[itemprop="publishDate"]',
+# (attribute, value) of the <meta> tags that may hold the publication date, in priority order
+META_DATE_KEYS = (
+    ("property", "article:published_time"),
+    ("property", "article:published"),
+    ("name", "publish-date"),
+    ("name", "publication-date"),
+    ("name", "date"),
+    ("name", "DC.date"),
+    ("name", "DC.Date"),
+    ("property", "og:published_time"),
+    ("name", "publishdate"),
+    ("name", "pub_date"),
+    ("itemprop", "datePublished"),
+    ("itemprop", "publishDate"),
+)
+META_DATE_ATTRS = ("property", "name", "itemprop")
+
+# Selectors are compiled once at import instead of on every page
+TIME_DATE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in ["time[datetime]", "time[pubdate]", ".published-date time", ".publish-date time", ".date time"]
+)
+CLASS_DATE_SELECTORS = tuple(
+    soupsieve.compile(selector)
+    for selector in [
+        ".published-date",
+        ".publish-date",
+        ".publication-date",
+        ".date-published",
+        ".article-date",
+        ".post-date",
+        ".entry-date",
+        ".timestamp",
+        '[class*="date"]',
+        '[class*="publish"]',
     ]
-    for selector in meta_selectors:
-        meta = soup.select_one(selector)
+)
+
+
+def get_pub_date_from_soup(soup, jsonld=None):
+    # try meta tags, indexing the first <meta> for each attribute value in one pass
+    metas = {}
+    for meta in soup.find_all("meta"):
+        for attr in META_DATE_ATTRS:
+            value = meta.get(attr)
+            if value is not None:
+                metas.setdefault((attr, value), meta)
+    for key in META_DATE_KEYS:
+        meta = metas.get(key)
         if meta:
             content = meta.get("content") or meta.get("value")
             if content:
@@ -221,15 +370,10 @@ def get_pub_date_from_soup(soup):
                 if parsed:
                     return parsed, "meta"
     # json-ld
+    if jsonld is None:
+        jsonld = parse_jsonld(soup)
     try:
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
-            if not script.string:
-                continue
-            try:
-                data = json.loads(script.string)
-            except Exception:
-                continue
+        for data in jsonld:
             items = data if isinstance(data, list) else [data]
             for item in items:
                 if isinstance(item, dict):
@@ -241,9 +385,8 @@ def get_pub_date_from_soup(soup):
     except Exception:
         pass
     # time tags and common selectors
-    time_selectors = ["time[datetime]", "time[pubdate]", ".published-date time", ".publish-date time", ".date time"]
-    for selector in time_selectors:
-        elem = soup.select_one(selector)
+    for selector in TIME_DATE_SELECTORS:
+        elem = selector.select_one(soup)
         if elem:
             dtattr = elem.get("datetime") or elem.get("pubdate")
             if dtattr:
@@ -256,82 +399,101 @@ def get_pub_date_from_soup(soup):
                 if parsed:
                     return parsed, "time_text"
     # article/date classes
-    date_selectors = [
-        ".published-date",
-        ".publish-date",
-        ".publication-date",
-        ".date-published",
-        ".article-date",
-        ".post-date",
-        ".entry-date",
-        ".timestamp",
-        '[class*="date"]',
-        '[class*="publish"]',
-    ]
-    for selector in date_selectors:
-        elems = soup.select(selector)
-        for e in elems:
+    for selector in CLASS_DATE_SELECTORS:
+        # iselect stops matching at the first element whose text parses
+        for e in selector.iselect(soup):
             text = e.get_text().strip()
             if text and len(text) < 100:
                 parsed = parse_date_string(text)
                 if parsed:
                     return parsed, "class_text"
-    # raw text patterns
+    # raw text patterns; matches are scanned lazily so the search stops at
+    # the first one that parses instead of collecting every match on the page
     text = soup.get_text()
-    patterns = [r"Published:?\s*([A-Za-z]+ \d{1,2},? \d{4})", r"(\d{1,2}/\d{1,2}/\d{4})", r"(\d{4}-\d{2}-\d{2})", r"([A-Za-z]+ \d{1,2},? \d{4})"]
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for m in matches:
-            parsed = parse_date_string(m)
+    for pattern in TEXT_DATE_PATTERNS:
+        for m in pattern.finditer(text):
+            parsed = parse_date_string(m.group(1))
             if parsed:
                 return parsed, "text_pattern"
     return None, "no_date_found"
 
 
-def get_wordcount_from_html(html_text, soup):
-    candidates = []
-    jsonld_text, jsonld_method = extract_json_ld_article_text(html_text)
-    if jsonld_text:
-        candidates.append((jsonld_text, jsonld_method))
-    tr_text, tr_method = extract_main_text_with_trafilatura(html_text)
-    if tr_text:
-        candidates.append((tr_text, tr_method))
+# Wordcount candidates in the order the fallback ranking breaks ties by
+WORDCOUNT_CANDIDATE_SLOTS = ("jsonld", "trafilatura", "article_p", "article_tag", "main_p", "all_p", "bs4", "body_full")
+# article_p, main_p, jsonld, trafilatura and article_tag win outright, in that order, at this many words
+PREFERRED_MIN_WORDCOUNT = 120
+
+
+def get_wordcount_from_html(html_text, soup, jsonld=None):
+    # (wordcount, method) by candidate slot. The preferred candidates are
+    # tried first and returned as soon as one is long enough, so trafilatura
+    # and the full-page texts are only built when they can matter.
+    scored = {}
+
+    def add_candidate(slot, text, method):
+        if text:
+            wc = count_words(text)
+            if wc > 0:
+                scored[slot] = (wc, method)
+
+    def is_preferred(slot):
+        return scored.get(slot, (0, None))[0] >= PREFERRED_MIN_WORDCOUNT
+
+    if jsonld is None:
+        jsonld = parse_jsonld(soup) if soup else []
     if soup:
         article_node = soup.find("article")
-        if article_node:
-            article_p_text = normalize_text(" ".join(p.get_text(" ", strip=True) for p in article_node.find_all("p")))
-            if article_p_text:
-                candidates.append((article_p_text, "article_p"))
-            article_raw = normalize_text(article_node.get_text(" ", strip=True))
-            if article_raw:
-                candidates.append((article_raw, "article_tag"))
         main_node = soup.find("main")
+        # Build each <p>'s text once and share it between the first
+        # <article>, the first <main> and the whole page
+        article_ps, main_ps, all_ps = [], [], []
+        for p in soup.find_all("p"):
+            p_text = p.get_text(" ", strip=True)
+            all_ps.append(p_text)
+            for parent in p.parents:
+                if parent is article_node:
+                    article_ps.append(p_text)
+                elif parent is main_node:
+                    main_ps.append(p_text)
+        if article_node:
+            add_candidate("article_p", normalize_text(" ".join(article_ps)), "article_p")
+            if is_preferred("article_p"):
+                return scored["article_p"][0], "success", "article_p"
         if main_node:
-            main_p_text = normalize_text(" ".join(p.get_text(" ", strip=True) for p in main_node.find_all("p")))
-            if main_p_text:
-                candidates.append((main_p_text, "main_p"))
-        all_p_text = normalize_text(" ".join(p.get_text(" ", strip=True) for p in soup.find_all("p")))
-        if all_p_text:
-            candidates.append((all_p_text, "all_p"))
+            add_candidate("main_p", normalize_text(" ".join(main_ps)), "main_p")
+            if is_preferred("main_p"):
+                return scored["main_p"][0], "success", "main_p"
+
+    add_candidate("jsonld", *extract_json_ld_article_text(jsonld))
+    if is_preferred("jsonld"):
+        return scored["jsonld"][0], "success", "jsonld"
+    add_candidate("trafilatura", *extract_main_text_with_trafilatura(html_text))
+    if is_preferred("trafilatura"):
+        return scored["trafilatura"][0], "success", "trafilatura"
+
+    if soup:
+        if article_node:
+            add_candidate("article_tag", normalize_text(article_node.get_text(" ", strip=True)), "article_tag")
+        add_candidate("all_p", normalize_text(" ".join(all_ps)), "all_p")
         bs4_text, bs4_method = extract_main_text_with_bs4(soup)
-        if bs4_text:
-            candidates.append((bs4_text, bs4_method))
+        add_candidate("bs4", bs4_text, bs4_method)
+        # bs4's article text, when it finds one, outranks the raw article text
+        if is_preferred("bs4") and bs4_method == "article_tag":
+            return scored["bs4"][0], "success", "article_tag"
+        if "bs4" not in scored or bs4_method != "article_tag":
+            if is_preferred("article_tag"):
+                return scored["article_tag"][0], "success", "article_tag"
         if soup.body:
-            body_text = normalize_text(soup.body.get_text(" ", strip=True))
-            if body_text:
-                candidates.append((body_text, "body_full"))
-    # score candidates
-    scored = []
-    for candidate_text, candidate_method in candidates:
-        wc = count_words(candidate_text)
-        if wc > 0:
-            scored.append((wc, candidate_method))
+            # Without an <article> or <main> the bs4 text already is the body text
+            if bs4_method == "body_fallback":
+                body_text = bs4_text
+            else:
+                body_text = normalize_text(soup.body.get_text(" ", strip=True))
+            add_candidate("body_full", body_text, "body_full")
+
+    scored = [scored[slot] for slot in WORDCOUNT_CANDIDATE_SLOTS if slot in scored]
     if not scored:
         return None, "no_text_found", "no_candidate_text"
-    wc_by_method = {method: wc for wc, method in scored}
-    for preferred in ["article_p", "main_p", "jsonld", "trafilatura", "article_tag"]:
-        if wc_by_method.get(preferred, 0) >= 120:
-            return wc_by_method[preferred], "success", preferred
     non_full = [(wc, method) for wc, method in scored if method not in {"all_p", "body_full"}]
     if non_full:
         best_wc, best_method = max(non_full, key=lambda item: item[0])
@@ -346,50 +508,22 @@ def get_wordcount_from_html(html_text, soup):
 
 # ---------- Document hyperlink extraction (from NewArticles) ----------
 
-def extract_hyperlink_method1(paragraph):
-    try:
-        for elem in paragraph._element.iter():
-            if "hyperlink" in str(elem.tag).lower():
-                r_id = elem.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-                if r_id and hasattr(paragraph.part, "rels") and r_id in paragraph.part.rels:
-                    url = paragraph.part.rels[r_id].target_ref
-                    return url
-    except Exception:
-        pass
-    return None
+# r:id of every w:hyperlink in a paragraph, in document order
+HYPERLINK_R_IDS = etree.XPath(".//w:hyperlink/@r:id", namespaces={"w": nsmap["w"], "r": nsmap["r"]})
 
 
-def extract_hyperlink_method2(paragraph):
-    try:
-        for run in paragraph.runs:
-            if run._element.rPr is not None:
-                for elem in run._element.iter():
-                    if "hyperlink" in str(elem.tag).lower():
-                        r_id = elem.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-                        if r_id and hasattr(paragraph.part, "rels") and r_id in paragraph.part.rels:
-                            url = paragraph.part.rels[r_id].target_ref
-                            return url
-    except Exception:
-        pass
-    return None
-
-
-def extract_hyperlink_method3(paragraph):
-    try:
-        xml_str = str(paragraph._element.xml)
-        hyperlink_pattern = r'r:id="(rId\d+)"'
-        matches = re.findall(hyperlink_pattern, xml_str)
-        for r_id in matches:
-            if hasattr(paragraph.part, "rels") and r_id in paragraph.part.rels:
-                url = paragraph.part.rels[r_id].target_ref
-                return url
-    except Exception:
-        pass
+def extract_hyperlink(paragraph, rels=None):
+    if rels is None:
+        rels = paragraph.part.rels
+    for r_id in HYPERLINK_R_IDS(paragraph._element):
+        if r_id in rels:
+            return rels[r_id].target_ref
     return None
 
 
 def extract_articles_and_links_from_docx(docx_path):
     doc = Document(docx_path)
+    rels = doc.part.rels
     articles = []
     for paragraph in doc.paragraphs:
         text = paragraph.text.strip()
@@ -398,15 +532,19 @@ def extract_articles_and_links_from_docx(docx_path):
         # treat any paragraph with a hyphen or with a URL as an article line
         if text.startswith("-") or "http" in text.lower():
             title = text.lstrip("- ").strip()
-            hyperlink_url = (
-                extract_hyperlink_method1(paragraph)
-                or extract_hyperlink_method2(paragraph)
-                or extract_hyperlink_method3(paragraph)
-            )
+            hyperlink_url = extract_hyperlink(paragraph, rels)
             articles.append({"title": title, "url": hyperlink_url})
     return articles
 
 
+def extract_page_details(html_text, soup):
+    """Return (pub_date, date_status, wordcount, wc_status, wc_method) for a parsed page."""
+    jsonld = parse_jsonld(soup)
+    pub_date, date_status = get_pub_date_from_soup(soup, jsonld)
+    wc, wc_status, wc_method = get_wordcount_from_html(html_text, soup, jsonld)
+    return pub_date, date_status, wc, wc_status, wc_method
+
+
 def fetch_url_once(url, timeout=30, cookie_jar=None):
     headers = {
         "User-Agent": (
@@ -419,10 +557,31 @@ def fetch_url_once(url, timeout=30, cookie_jar=None):
         "Connection": "keep-alive",
     }
     try:
-        resp = HTTP_SESSION.get(url, headers=headers, timeout=timeout, cookies=cookie_jar)
-        status_code = resp.status_code
-        html_text = resp.text
-        soup = BeautifulSoup(resp.content, "html.parser")
+        with HTTP_SESSION.get(url, headers=headers, timeout=timeout, cookies=cookie_jar, stream=True) as resp:
+            status_code = resp.status_code
+            content_type = resp.headers.get("Content-Type", "").lower()
+            if status_code < 400 and content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                logger.info(f"Skipping non-HTML content ({content_type}) for {url}")
+                return None, None, "non_html"
+            content_length = resp.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+                logger.warning(f"Skipping {content_length}-byte response for {url}")
+                return None, None, "too_large"
+            # iter_content, unlike resp.raw, turns stalled or truncated bodies into requests exceptions
+            chunks = []
+            size = 0
+            for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            body = b"".join(chunks)[:MAX_PAGE_BYTES]
+            # A charset in the headers is tried first, then the page's own <meta> declaration
+            known_encodings = [resp.encoding] if "charset=" in content_type else []
+        # Decode once and parse the same text, instead of decoding for
+        # resp.text and again inside BeautifulSoup
+        html_text = UnicodeDammit(body, known_definite_encodings=known_encodings, is_html=True).unicode_markup
+        soup = BeautifulSoup(html_text, HTML_PARSER)
         if status_code >= 400:
             logger.warning(f"HTTP {status_code} for {url}")
             return html_text, soup, f"http_{status_code}"
@@ -449,7 +608,7 @@ def sanitize_url_for_filename(url):
     if path.endswith("/"):
         path = path[:-1]
     candidate = f"{host}{path}"
-    candidate = re.sub(r"[^a-zA-Z0-9._-]+", "_", candidate)
+    candidate = UNSAFE_FILENAME_PATTERN.sub("_", candidate)
     return candidate.strip("_")
 
 
@@ -480,7 +639,7 @@ def find_local_html_path(article, url, local_html_dir=None, local_html_path_colu
     parsed = urlparse(url)
     slug = Path(parsed.path).name
     if slug:
-        slug_pattern = re.sub(r"[^a-zA-Z0-9._-]+", "_", slug).lower()
+        slug_pattern = UNSAFE_FILENAME_PATTERN.sub("_", slug).lower()
         for candidate in directory.glob("*.htm*"):
             if slug_pattern in candidate.stem.lower():
                 return candidate
@@ -500,7 +659,7 @@ def fetch_local_html(article, url, local_html_dir=None, local_html_path_column="
 
     try:
         html_text = local_path.read_text(encoding="utf-8", errors="ignore")
-        soup = BeautifulSoup(html_text, "html.parser")
+        soup = BeautifulSoup(html_text, HTML_PARSER)
         return html_text, soup, str(local_path), "success"
     except Exception as exc:
         logger.warning("Failed reading local HTML %s: %s", local_path, exc)
@@ -519,8 +678,8 @@ def save_failed_response_html(url, html_text, local_html_dir, status_label, atte
         return None
 
     url_key = sanitize_url_for_filename(url) or "failed_url"
-    safe_status = re.sub(r"[^a-zA-Z0-9._-]+", "_", (status_label or "error"))
-    safe_attempt = re.sub(r"[^a-zA-Z0-9._-]+", "_", (attempt_label or "attempt"))
+    safe_status = UNSAFE_FILENAME_PATTERN.sub("_", (status_label or "error"))
+    safe_attempt = UNSAFE_FILENAME_PATTERN.sub("_", (attempt_label or "attempt"))
     save_path = directory / f"{url_key}__{safe_attempt}__{safe_status}.html"
 
     try:
@@ -532,6 +691,72 @@ def save_failed_response_html(url, html_text, local_html_dir, status_label, atte
         return None
 
 
+def page_cache_file(url, page_cache_dir):
+    """Pages are stored one file per URL, named by the SHA-1 of the URL."""
+    return os.path.join(page_cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+
+
+def cached_page_path(url, page_cache_dir):
+    """Return the saved HTML file for `url` if it is fresh enough to reuse, else None."""
+    if not page_cache_dir:
+        return None
+    path = page_cache_file(url, page_cache_dir)
+    try:
+        if time.time() - os.path.getmtime(path) <= PAGE_CACHE_MAX_AGE:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def save_cached_page(url, html_text, page_cache_dir):
+    """Store fetched HTML so later runs can re-extract it without refetching."""
+    if not page_cache_dir:
+        return
+    path = page_cache_file(url, page_cache_dir)
+    try:
+        os.makedirs(page_cache_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8", errors="surrogatepass") as fh:
+            fh.write(html_text)
+    except OSError as exc:
+        logger.warning("Failed to cache page HTML for %s: %s", url, exc)
+
+
+def build_cache_path(input_path):
+    """Keep the result cache next to the input file."""
+    root, _ = os.path.splitext(input_path)
+    return f"{root}_tag_cache.json"
+
+
+def load_tag_cache(cache_path):
+    """Load results of pages fetched on earlier runs, keyed by URL, dropping expired entries."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable result cache %s: %s", cache_path, exc)
+        return {}
+    cutoff = time.time() - TAG_CACHE_MAX_AGE
+    return {url: entry for url, entry in cache.items() if entry.get("fetched_at", 0) >= cutoff}
+
+
+def save_tag_cache(cache, cache_path):
+    """Write page results so later runs can skip refetching."""
+    if not cache_path:
+        return
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=1)
+
+
+def cache_article_result(cache, article):
+    if cache is not None:
+        entry = {field: article[field] for field in CACHED_FIELDS}
+        entry["fetched_at"] = time.time()
+        cache[article["url"]] = entry
+
+
 def should_attempt_manual_retry(fetch_status):
     if not fetch_status:
         return False
@@ -540,6 +765,148 @@ def should_attempt_manual_retry(fetch_status):
     return fetch_status in {"request_error", "timeout"}
 
 
+def tag_article(
+    article,
+    manual_browser_retry=False,
+    browser_cookies=None,
+    manual_wait_seconds=20,
+    local_html_dir=None,
+    local_html_path_column="local_html_path",
+    cache=None,
+    page_cache_dir=None,
+):
+    """Fetch one article and update it in place; returns True if its wordcount was found.
+
+    Results of successfully fetched pages are also stored in `cache` when given.
+    With `page_cache_dir`, HTML saved there on an earlier run is parsed instead
+    of fetching the URL, and newly fetched pages are saved to it.
+    """
+    url = article.get("url")
+    title = article.get("title") or ""
+    succeeded = False
+    cached_path = cached_page_path(url, page_cache_dir)
+    if cached_path:
+        with open(cached_path, encoding="utf-8", errors="surrogatepass") as fh:
+            html_text = fh.read()
+        soup = BeautifulSoup(html_text, HTML_PARSER)
+        fetch_status = "success"
+    else:
+        html_text, soup, fetch_status = fetch_url_once(url)
+        if fetch_status == "success":
+            save_cached_page(url, html_text, page_cache_dir)
+    failed_html_path = None
+    if fetch_status != "success":
+        failed_html_path = save_failed_response_html(
+            url,
+            html_text,
+            local_html_dir=local_html_dir,
+            status_label=fetch_status,
+            attempt_label="initial",
+        )
+        retried_status = fetch_status
+        if manual_browser_retry and should_attempt_manual_retry(fetch_status):
+            logger.info("Manual browser retry enabled for %s", url)
+            try:
+                opened = webbrowser.open(url, new=2)
+                if opened:
+                    logger.info("Opened URL in your default browser for manual unlock.")
+                else:
+                    logger.warning("Could not automatically open browser. Open URL manually: %s", url)
+            except Exception as open_error:
+                logger.warning("Failed to open browser automatically for %s: %s", url, open_error)
+            logger.info("Let the page fully load in your browser, then press Enter here to retry.")
+            proceed_with_retry = False
+            if sys.stdin and sys.stdin.isatty():
+                try:
+                    input("Press Enter to retry this URL now... ")
+                    proceed_with_retry = True
+                except EOFError:
+                    logger.warning("No interactive input available for %s", url)
+            else:
+                wait_seconds = max(0, int(manual_wait_seconds))
+                if wait_seconds > 0:
+                    logger.warning(
+                        "No interactive stdin; waiting %ds before retry so you can open the URL in your browser.",
+                        wait_seconds,
+                    )
+                    time.sleep(wait_seconds)
+                    proceed_with_retry = True
+                else:
+                    logger.warning("No interactive stdin and --manual-wait-seconds=0; skipping manual retry for %s", url)
+
+            if proceed_with_retry:
+                cookie_jar = None
+                if browser_cookies:
+                    try:
+                        cookie_jar = get_browser_cookie_jar(browser_cookies, url)
+                        logger.info("Loaded browser cookies from %s for %s", browser_cookies, url)
+                    except Exception as cookie_error:
+                        logger.warning("Could not load %s cookies for %s: %s", browser_cookies, url, cookie_error)
+                html_text, soup, retry_status = fetch_url_once(url, cookie_jar=cookie_jar)
+                if retry_status == "success":
+                    save_cached_page(url, html_text, page_cache_dir)
+                    pub_date, date_status, wc, wc_status, wc_method = extract_page_details(html_text, soup)
+                    article.update({"pub_date": pub_date, "date_status": date_status, "wordcount": wc, "wc_status": wc_status, "wc_method": wc_method})
+                    cache_article_result(cache, article)
+                    if wc_status == "success":
+                        succeeded = True
+                    retried_status = "success"
+                else:
+                    manual_failed_html_path = save_failed_response_html(
+                        url,
+                        html_text,
+                        local_html_dir=local_html_dir,
+                        status_label=retry_status,
+                        attempt_label="manual",
+                    )
+                    if manual_failed_html_path:
+                        failed_html_path = manual_failed_html_path
+                    retried_status = f"manual_{retry_status}"
+
+        if retried_status != "success":
+            local_html_text, local_html_soup, local_html_source, local_html_status = fetch_local_html(
+                article,
+                url,
+                local_html_dir=local_html_dir,
+                local_html_path_column=local_html_path_column,
+            )
+            if local_html_status == "success":
+                pub_date, date_status, wc, wc_status, wc_method = extract_page_details(local_html_text, local_html_soup)
+                article.update(
+                    {
+                        "pub_date": pub_date,
+                        "date_status": f"local_{date_status}",
+                        "wordcount": wc,
+                        "wc_status": f"local_{wc_status}",
+                        "wc_method": f"local_{wc_method}" if wc_method else "local",
+                        "local_html_path": local_html_source or failed_html_path,
+                    }
+                )
+                if wc_status == "success":
+                    succeeded = True
+            else:
+                article.update(
+                    {
+                        "pub_date": None,
+                        "date_status": retried_status,
+                        "wordcount": None,
+                        "wc_status": retried_status,
+                        "wc_method": None,
+                        "local_html_path": local_html_source or failed_html_path,
+                    }
+                )
+    else:
+        pub_date, date_status, wc, wc_status, wc_method = extract_page_details(html_text, soup)
+        article.update({"pub_date": pub_date, "date_status": date_status, "wordcount": wc, "wc_status": wc_status, "wc_method": wc_method, "local_html_path": None})
+        cache_article_result(cache, article)
+        if date_status == "no_date_found":
+            logger.info(f"No date for: {title[:60]}")
+        if wc_status == "success":
+            succeeded = True
+
+    return succeeded
+
+
 def process_articles(
     articles,
     delay=2.0,
@@ -549,151 +916,105 @@ def process_articles(
     manual_wait_seconds=20,
     local_html_dir=None,
     local_html_path_column="local_html_path",
+    max_workers=8,
+    cache_path=None,
+    page_cache_dir=None,
 ):
-    total = len(articles)
+    """Tag every article in place with its publication date and wordcount.
+
+    Different hosts are fetched in parallel while each host still sees one
+    request at a time, started at least `delay` seconds after the previous
+    one; time spent waiting on a slow response or parsing it counts toward
+    that delay. Manual browser retries wait for input, so they fetch one
+    host at a time.
+
+    When `page_cache_dir` is given, the HTML of every successfully fetched
+    page is kept there, and later runs parse those files again instead of
+    fetching, so changed date or wordcount heuristics apply to them without
+    network or host delays.
+
+    When `cache_path` is given, the extracted results themselves are read
+    from that JSON file instead of fetching and parsing again, and new ones
+    are saved to it. Those results do not pick up heuristic changes. Failed
+    fetches are not cached, so they are retried next run.
+    """
+    cache = load_tag_cache(cache_path) if cache_path else None
+    progress = count(1)
+    lock = threading.Lock()
     processed = 0
     success_count = 0
+    cached_count = 0
     start = time.perf_counter()
-    for idx, article in enumerate(articles, 1):
+
+    articles_by_host = defaultdict(list)
+    for article in articles:
         url = article.get("url")
-        title = article.get("title") or ""
         if not url:
             article.update({"pub_date": None, "date_status": "no_url", "wordcount": None, "wc_status": "no_url", "wc_method": None})
             continue
-        processed += 1
-        logger.info(f"[{processed}/{total}] Fetching {url[:90]}")
-        html_text, soup, fetch_status = fetch_url_once(url)
-        failed_html_path = None
-        if fetch_status != "success":
-            failed_html_path = save_failed_response_html(
-                url,
-                html_text,
+        entry = cache.get(url) if cache else None
+        if entry:
+            article.update({field: entry[field] for field in CACHED_FIELDS})
+            article["local_html_path"] = None
+            cached_count += 1
+            continue
+        articles_by_host[urlparse(url).netloc].append(article)
+
+    if cached_count:
+        logger.info("Using cached results for %d articles", cached_count)
+    total = sum(len(host_articles) for host_articles in articles_by_host.values())
+
+    def process_host_articles(host_articles):
+        nonlocal processed, success_count
+        next_request_at = 0.0
+        for article in host_articles:
+            if cached_page_path(article["url"], page_cache_dir):
+                # Served from the page cache, so the host is not contacted
+                logger.info(f"[{next(progress)}/{total}] Re-reading cached page {article['url'][:90]}")
+            else:
+                wait = next_request_at - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+                next_request_at = time.perf_counter() + delay
+                logger.info(f"[{next(progress)}/{total}] Fetching {article['url'][:90]}")
+            succeeded = tag_article(
+                article,
+                manual_browser_retry=manual_browser_retry,
+                browser_cookies=browser_cookies,
+                manual_wait_seconds=manual_wait_seconds,
                 local_html_dir=local_html_dir,
-                status_label=fetch_status,
-                attempt_label="initial",
+                local_html_path_column=local_html_path_column,
+                cache=cache,
+                page_cache_dir=page_cache_dir,
             )
-            retried_status = fetch_status
-            if manual_browser_retry and should_attempt_manual_retry(fetch_status):
-                logger.info("Manual browser retry enabled for %s", url)
-                try:
-                    opened = webbrowser.open(url, new=2)
-                    if opened:
-                        logger.info("Opened URL in your default browser for manual unlock.")
-                    else:
-                        logger.warning("Could not automatically open browser. Open URL manually: %s", url)
-                except Exception as open_error:
-                    logger.warning("Failed to open browser automatically for %s: %s", url, open_error)
-                logger.info("Let the page fully load in your browser, then press Enter here to retry.")
-                proceed_with_retry = False
-                if sys.stdin and sys.stdin.isatty():
-                    try:
-                        input("Press Enter to retry this URL now... ")
-                        proceed_with_retry = True
-                    except EOFError:
-                        logger.warning("No interactive input available for %s", url)
-                else:
-                    wait_seconds = max(0, int(manual_wait_seconds))
-                    if wait_seconds > 0:
-                        logger.warning(
-                            "No interactive stdin; waiting %ds before retry so you can open the URL in your browser.",
-                            wait_seconds,
-                        )
-                        time.sleep(wait_seconds)
-                        proceed_with_retry = True
-                    else:
-                        logger.warning("No interactive stdin and --manual-wait-seconds=0; skipping manual retry for %s", url)
-
-                if proceed_with_retry:
-                    cookie_jar = None
-                    if browser_cookies:
-                        try:
-                            cookie_jar = get_browser_cookie_jar(browser_cookies, url)
-                            logger.info("Loaded browser cookies from %s for %s", browser_cookies, url)
-                        except Exception as cookie_error:
-                            logger.warning("Could not load %s cookies for %s: %s", browser_cookies, url, cookie_error)
-                    html_text, soup, retry_status = fetch_url_once(url, cookie_jar=cookie_jar)
-                    if retry_status == "success":
-                        pub_date, date_status = get_pub_date_from_soup(soup)
-                        wc, wc_status, wc_method = get_wordcount_from_html(html_text, soup)
-                        article.update({"pub_date": pub_date, "date_status": date_status, "wordcount": wc, "wc_status": wc_status, "wc_method": wc_method})
-                        if wc_status == "success":
-                            success_count += 1
-                        retried_status = "success"
-                    else:
-                        manual_failed_html_path = save_failed_response_html(
-                            url,
-                            html_text,
-                            local_html_dir=local_html_dir,
-                            status_label=retry_status,
-                            attempt_label="manual",
-                        )
-                        if manual_failed_html_path:
-                            failed_html_path = manual_failed_html_path
-                        retried_status = f"manual_{retry_status}"
-
-            if retried_status != "success":
-                local_html_text, local_html_soup, local_html_source, local_html_status = fetch_local_html(
-                    article,
-                    url,
-                    local_html_dir=local_html_dir,
-                    local_html_path_column=local_html_path_column,
-                )
-                if local_html_status == "success":
-                    pub_date, date_status = get_pub_date_from_soup(local_html_soup)
-                    wc, wc_status, wc_method = get_wordcount_from_html(local_html_text, local_html_soup)
-                    article.update(
-                        {
-                            "pub_date": pub_date,
-                            "date_status": f"local_{date_status}",
-                            "wordcount": wc,
-                            "wc_status": f"local_{wc_status}",
-                            "wc_method": f"local_{wc_method}" if wc_method else "local",
-                            "local_html_path": local_html_source or failed_html_path,
-                        }
-                    )
-                    if wc_status == "success":
-                        success_count += 1
-                else:
-                    article.update(
-                        {
-                            "pub_date": None,
-                            "date_status": retried_status,
-                            "wordcount": None,
-                            "wc_status": retried_status,
-                            "wc_method": None,
-                            "local_html_path": local_html_source or failed_html_path,
-                        }
-                    )
-        else:
-            pub_date, date_status = get_pub_date_from_soup(soup)
-            wc, wc_status, wc_method = get_wordcount_from_html(html_text, soup)
-            article.update({"pub_date": pub_date, "date_status": date_status, "wordcount": wc, "wc_status": wc_status, "wc_method": wc_method, "local_html_path": None})
-            if date_status == "no_date_found":
-                logger.info(f"No date for: {title[:60]}")
-            if wc_status == "success":
-                success_count += 1
-
-        if heartbeat_every > 0 and processed % heartbeat_every == 0:
-            elapsed = time.perf_counter() - start
-            avg = elapsed / processed if processed else 0
-            remaining = max(total - processed, 0)
-            eta = avg * remaining
-            logger.info("HEARTBEAT: %d/%d elapsed=%.1fs eta=%.1fs success_wc=%d", processed, total, elapsed, eta, success_count)
-
-        if processed < total:
-            time.sleep(delay)
+            with lock:
+                processed += 1
+                success_count += succeeded
+                if heartbeat_every > 0 and processed % heartbeat_every == 0:
+                    elapsed = time.perf_counter() - start
+                    avg = elapsed / processed if processed else 0
+                    remaining = max(total - processed, 0)
+                    eta = avg * remaining
+                    logger.info("HEARTBEAT: %d/%d elapsed=%.1fs eta=%.1fs success_wc=%d", processed, total, elapsed, eta, success_count)
+
+    if manual_browser_retry:
+        max_workers = 1
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(process_host_articles, articles_by_host.values()))
+    finally:
+        if processed:
+            save_tag_cache(cache, cache_path)
 
     return articles
 
 
+RESULT_COLUMNS = ["title", "url", "pub_date", "date_status", "wordcount", "wc_status", "wc_method", "local_html_path"]
+
+
 def save_results_csv(articles, output_csv_path):
-    df = pd.DataFrame(articles)
-    # normalize column names
-    desired = ["title", "url", "pub_date", "date_status", "wordcount", "wc_status", "wc_method", "local_html_path"]
-    for col in desired:
-        if col not in df.columns:
-            df[col] = None
-    df = df[desired]
+    # build the output columns directly instead of inferring them from every dict
+    df = pd.DataFrame({col: [article.get(col) for article in articles] for col in RESULT_COLUMNS})
     output_dir = os.path.dirname(output_csv_path)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -701,14 +1022,19 @@ def save_results_csv(articles, output_csv_path):
     logger.info(f"Saved results to {output_csv_path}")
 
 
+URL_COLUMN_NAMES = ("url", "URL", "link", "Link", "href")
+URL_PATTERN = re.compile(r"https?://")
+
+
 def detect_url_column(df):
-    for candidate in ["url", "URL", "link", "Link"]:
+    for candidate in URL_COLUMN_NAMES:
         if candidate in df.columns:
             return candidate
-    # fallback: find first column with http in any row
-    for col in df.columns:
-        sample = df[col].astype(str).head(50).str.contains(r"https?://")
-        if sample.any():
+    # fallback: find first column with http in any of the first rows,
+    # stringifying that sample once for all columns
+    sample = df.head(50).astype(str)
+    for col in sample.columns:
+        if sample[col].str.contains(URL_PATTERN, na=False).any():
             return col
     return None
 
@@ -718,7 +1044,8 @@ def main():
     parser.add_argument("--docx", help="Path to Word docx with article list")
     parser.add_argument("--csv", help="Path to CSV input with URLs")
     parser.add_argument("-o", "--output", help="Output CSV path")
-    parser.add_argument("--delay", type=float, default=2.0, help="Delay between requests")
+    parser.add_argument("--delay", type=float, default=2.0, help="Minimum seconds between requests to the same host")
+    parser.add_argument("--workers", type=int, default=8, help="Number of hosts to fetch from in parallel")
     parser.add_argument("--heartbeat-every", type=int, default=10, help="Heartbeat frequency")
     parser.add_argument(
         "--manual-browser-retry",
@@ -740,6 +1067,21 @@ def main():
         "--local-html-dir",
         help="Directory to search for saved .html/.htm files when URL fetch fails.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory to keep fetched page HTML in; later runs re-extract these pages instead of refetching them.",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        nargs="?",
+        const=True,
+        help=(
+            "Reuse extracted results from earlier runs, stored in this JSON file "
+            "(default: input filename plus _tag_cache.json). Off unless given; results "
+            "are not recomputed when extraction changes."
+        ),
+    )
     parser.add_argument(
         "--local-html-path-column",
         default="local_html_path",
@@ -764,11 +1106,17 @@ def main():
             if c in df.columns:
                 title_col = c
                 break
-        for _, row in df.iterrows():
-            url = row[url_col]
-            title = row[title_col] if title_col else ""
-            local_html_path = row[args.local_html_path_column] if args.local_html_path_column in df.columns else None
-            articles.append({"title": title, "url": url, args.local_html_path_column: local_html_path})
+        # pull whole columns as lists instead of building a Series per row
+        urls = df[url_col].tolist()
+        titles = df[title_col].tolist() if title_col else [""] * len(urls)
+        if args.local_html_path_column in df.columns:
+            local_html_paths = df[args.local_html_path_column].tolist()
+        else:
+            local_html_paths = [None] * len(urls)
+        articles = [
+            {"title": title, "url": url, args.local_html_path_column: local_html_path}
+            for title, url, local_html_path in zip(titles, urls, local_html_paths)
+        ]
     else:
         parser.error("Provide either --docx or --csv input")
 
@@ -788,6 +1136,9 @@ def main():
         manual_wait_seconds=args.manual_wait_seconds,
         local_html_dir=args.local_html_dir,
         local_html_path_column=args.local_html_path_column,
+        max_workers=max(1, args.workers),
+        cache_path=build_cache_path(args.docx or args.csv) if args.cache_path is True else args.cache_path,
+        page_cache_dir=args.cache_dir,
     )
 
     if args.output:
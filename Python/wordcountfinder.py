@@ -3,17 +3,44 @@ import json
 import logging
 import os
 import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    def json_loads(text):
+        """Decode with orjson, retrying with json for input only it accepts (NaN, lone surrogates)"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+except Exception:
+    json_loads = json.loads
 
 try:
     import trafilatura
 except Exception:
     trafilatura = None
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
+
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -33,53 +60,72 @@ BOILERPLATE_TAGS = [
     "form",
 ]
 
-BOILERPLATE_CLASS_ID_PATTERN = re.compile(
-    r"(^|[-_\s])(ad|ads|advert|advertisement|sponsor|promo|related|newsletter|"
-    r"footer|sidebar|share|social|cookie|banner|recommend|trending|outbrain|"
-    r"taboola)($|[-_\s])",
-    re.IGNORECASE,
+# A class/id marks boilerplate when any of its -, _ or whitespace separated words is one of these
+BOILERPLATE_CLASS_ID_TOKENS = frozenset(
+    [
+        "ad", "ads", "advert", "advertisement", "sponsor", "promo", "related", "newsletter",
+        "footer", "sidebar", "share", "social", "cookie", "banner", "recommend", "trending",
+        "outbrain", "taboola",
+    ]
 )
 
+JSONLD_TEXT_KEYS = frozenset(["articleBody", "text", "description"])
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+WORD_PATTERN = re.compile(r"\b[\w'-]+\b")
+
+# Wordcount candidates in the order the fallback ranking breaks ties by
+WORDCOUNT_CANDIDATE_SLOTS = ("jsonld", "trafilatura", "article_p", "article_tag", "main_p", "all_p", "bs4", "body_full")
+# article_p, main_p, jsonld, trafilatura and article_tag win outright, in that order, at this many words
+PREFERRED_MIN_WORDCOUNT = 120
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+
+# Word counts found on earlier runs are reused for this long
+WORDCOUNT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+STREAM_CHUNK_SIZE = 65536
+
 
 def normalize_text(text):
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
 
 
 def count_words(text):
-    words = re.findall(r"\b[\w'-]+\b", text)
-    return len(words)
+    # subn counts the matches without building a list of every word
+    return WORD_PATTERN.subn("", text)[1]
 
 
-def extract_json_ld_article_text(html_text):
+def extract_json_ld_article_text(soup):
     """Extract article-like text from JSON-LD fields such as articleBody."""
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
         scripts = soup.find_all("script", type="application/ld+json")
         candidates = []
 
-        def collect_texts(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in {"articleBody", "text", "description"}:
-                        text_val = normalize_text(value)
-                        if text_val:
-                            candidates.append(text_val)
-                    else:
-                        collect_texts(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    collect_texts(item)
-
         for script in scripts:
             if not script.string:
                 continue
             try:
-                data = json.loads(script.string)
+                data = json_loads(str(script.string))
             except Exception:
                 continue
-            collect_texts(data)
+
+            # Walk the JSON graph with an explicit stack instead of recursing
+            stack = [data]
+            while stack:
+                obj = stack.pop()
+                if isinstance(obj, dict):
+                    for key, value in obj.items():
+                        if key in JSONLD_TEXT_KEYS:
+                            text_val = normalize_text(value)
+                            if text_val:
+                                candidates.append(text_val)
+                        else:
+                            stack.append(value)
+                elif isinstance(obj, list):
+                    stack.extend(obj)
 
         if not candidates:
             return "", "jsonld_unavailable"
@@ -90,16 +136,24 @@ def extract_json_ld_article_text(html_text):
         return "", "jsonld_failed"
 
 
+def is_boilerplate_marker(marker):
+    words = marker.casefold().replace("-", " ").replace("_", " ").split()
+    return not BOILERPLATE_CLASS_ID_TOKENS.isdisjoint(words)
+
+
 def extract_main_text_with_bs4(soup):
     for tag in soup(["script", "style", "noscript", "svg", "iframe"]):
         tag.decompose()
 
     nodes_to_remove = []
     for node in soup.find_all(True):
+        # Most elements carry neither attribute; skip building a marker for them
+        if "class" not in node.attrs and "id" not in node.attrs:
+            continue
         class_attr = " ".join(node.get("class", []))
         id_attr = node.get("id", "")
         marker = f"{class_attr} {id_attr}".strip()
-        if marker and BOILERPLATE_CLASS_ID_PATTERN.search(marker):
+        if marker and is_boilerplate_marker(marker):
             nodes_to_remove.append(node)
 
     for node in nodes_to_remove:
@@ -139,97 +193,147 @@ def extract_main_text_with_trafilatura(html_text):
     return "", "trafilatura_failed"
 
 
-def get_article_word_count(url):
-    """Visit URL and estimate article word count from page text."""
-    try:
-        headers = {
+def build_http_session():
+    session = requests.Session()
+    session.headers.update(
+        {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/91.0.4472.124 Safari/537.36"
             )
         }
+    )
+    retry = Retry(total=2, backoff_factor=0.3)
+    # Kept-alive connections are reused across URLs on the same host
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
 
-        html_text = response.text
-        candidates = []
+HTTP_SESSION = build_http_session()
 
-        jsonld_text, jsonld_method = extract_json_ld_article_text(html_text)
-        if jsonld_text:
-            candidates.append((jsonld_text, jsonld_method))
 
-        tr_text, tr_method = extract_main_text_with_trafilatura(html_text)
-        if tr_text:
-            candidates.append((tr_text, tr_method))
+def estimate_word_count(body, declared_encoding=None):
+    """Estimate the article word count of one downloaded page.
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    Returns (word_count, status, method) like get_article_word_count. Kept
+    at module level so it can also run in a ProcessPoolExecutor.
+    """
+    # (wordcount, method) by candidate slot. The preferred candidates are
+    # tried first and returned as soon as one is long enough, so trafilatura
+    # and the full-page texts are only built when they can matter.
+    scored = {}
 
-        article_node = soup.find("article")
-        if article_node:
-            article_p_text = normalize_text(
-                " ".join(p.get_text(" ", strip=True) for p in article_node.find_all("p"))
-            )
-            if article_p_text:
-                candidates.append((article_p_text, "article_p"))
+    def add_candidate(slot, text, method):
+        if text:
+            wc = count_words(text)
+            if wc > 0:
+                scored[slot] = (wc, method)
 
-            article_raw_text = normalize_text(article_node.get_text(" ", strip=True))
-            if article_raw_text:
-                candidates.append((article_raw_text, "article_tag"))
+    def is_preferred(slot):
+        return scored.get(slot, (0, None))[0] >= PREFERRED_MIN_WORDCOUNT
 
-        main_node = soup.find("main")
-        if main_node:
-            main_p_text = normalize_text(
-                " ".join(p.get_text(" ", strip=True) for p in main_node.find_all("p"))
-            )
-            if main_p_text:
-                candidates.append((main_p_text, "main_p"))
+    # Decoded once for both trafilatura and BeautifulSoup. A charset from the
+    # headers is tried first, then the page's own <meta> declaration.
+    known_encodings = [declared_encoding] if declared_encoding else []
+    html_text = UnicodeDammit(body, known_definite_encodings=known_encodings, is_html=True).unicode_markup
 
-        all_p_text = normalize_text(
-            " ".join(p.get_text(" ", strip=True) for p in soup.find_all("p"))
-        )
-        if all_p_text:
-            candidates.append((all_p_text, "all_p"))
+    # Parsed once; extract_main_text_with_bs4 prunes it, so it runs last.
+    # Candidates other than JSON-LD and trafilatura are only counted, and
+    # collapsing whitespace does not change the count, so they skip
+    # normalize_text.
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+
+    article_node = soup.find("article")
+    if article_node:
+        article_p_text = " ".join(p.get_text(" ", strip=True) for p in article_node.find_all("p"))
+        add_candidate("article_p", article_p_text, "article_p")
+        if is_preferred("article_p"):
+            return scored["article_p"][0], "success", "article_p"
 
-        bs4_text, bs4_method = extract_main_text_with_bs4(soup)
-        if bs4_text:
-            candidates.append((bs4_text, bs4_method))
+    main_node = soup.find("main")
+    if main_node:
+        main_p_text = " ".join(p.get_text(" ", strip=True) for p in main_node.find_all("p"))
+        add_candidate("main_p", main_p_text, "main_p")
+        if is_preferred("main_p"):
+            return scored["main_p"][0], "success", "main_p"
 
-        if soup.body:
-            body_text = normalize_text(soup.body.get_text(" ", strip=True))
-            if body_text:
-                candidates.append((body_text, "body_full"))
+    add_candidate("jsonld", *extract_json_ld_article_text(soup))
+    if is_preferred("jsonld"):
+        return scored["jsonld"][0], "success", "jsonld"
 
-        scored = []
-        for candidate_text, candidate_method in candidates:
-            wc = count_words(candidate_text)
-            if wc > 0:
-                scored.append((wc, candidate_method))
+    add_candidate("trafilatura", *extract_main_text_with_trafilatura(html_text))
+    if is_preferred("trafilatura"):
+        return scored["trafilatura"][0], "success", "trafilatura"
 
-        if not scored:
-            return None, "no_text_found", "no_candidate_text"
+    if article_node:
+        add_candidate("article_tag", article_node.get_text(" ", strip=True), "article_tag")
 
-        wc_by_method = {method: wc for wc, method in scored}
+    all_p_text = " ".join(p.get_text(" ", strip=True) for p in soup.find_all("p"))
+    add_candidate("all_p", all_p_text, "all_p")
 
-        for preferred_method in ["article_p", "main_p", "jsonld", "trafilatura", "article_tag"]:
-            preferred_wc = wc_by_method.get(preferred_method, 0)
-            if preferred_wc >= 120:
-                return preferred_wc, "success", preferred_method
+    bs4_text, bs4_method = extract_main_text_with_bs4(soup)
+    add_candidate("bs4", bs4_text, bs4_method)
+    # bs4's article text, when it finds one, outranks the raw article text
+    if bs4_method == "article_tag" and "bs4" in scored:
+        if is_preferred("bs4"):
+            return scored["bs4"][0], "success", "article_tag"
+    elif is_preferred("article_tag"):
+        return scored["article_tag"][0], "success", "article_tag"
 
-        non_fullpage = [(wc, method) for wc, method in scored if method not in {"all_p", "body_full"}]
-        if non_fullpage:
-            best_wc, best_method = max(non_fullpage, key=lambda item: item[0])
-            return best_wc, "success", best_method
+    if soup.body:
+        add_candidate("body_full", soup.body.get_text(" ", strip=True), "body_full")
 
-        ranked = sorted(scored, key=lambda item: item[0], reverse=True)
-        if len(ranked) >= 2 and ranked[0][0] > int(ranked[1][0] * 1.6) and (ranked[0][0] - ranked[1][0]) > 500:
-            best_wc, best_method = ranked[1]
-        else:
-            best_wc, best_method = ranked[0]
+    scored = [scored[slot] for slot in WORDCOUNT_CANDIDATE_SLOTS if slot in scored]
+    if not scored:
+        return None, "no_text_found", "no_candidate_text"
 
+    non_fullpage = [(wc, method) for wc, method in scored if method not in {"all_p", "body_full"}]
+    if non_fullpage:
+        best_wc, best_method = max(non_fullpage, key=lambda item: item[0])
         return best_wc, "success", best_method
 
+    ranked = sorted(scored, key=lambda item: item[0], reverse=True)
+    if len(ranked) >= 2 and ranked[0][0] > int(ranked[1][0] * 1.6) and (ranked[0][0] - ranked[1][0]) > 500:
+        best_wc, best_method = ranked[1]
+    else:
+        best_wc, best_method = ranked[0]
+
+    return best_wc, "success", best_method
+
+
+def get_article_word_count(url, parse_pool=None):
+    """Visit URL and estimate article word count from page text.
+
+    With a `parse_pool` (a ProcessPoolExecutor), the downloaded page is
+    parsed in one of its processes while this thread waits for the result.
+    """
+    try:
+        with HTTP_SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "").lower()
+            if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                return None, "non_html", "non_html_content"
+
+            # Anything past the cap is left unread. iter_content, unlike
+            # response.raw, turns stalled or truncated bodies into requests exceptions
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+            body = b"".join(chunks)[:MAX_PAGE_BYTES]
+            declared_encoding = response.encoding if "charset=" in content_type else None
+
+        if parse_pool is None:
+            return estimate_word_count(body, declared_encoding)
+        return parse_pool.submit(estimate_word_count, body, declared_encoding).result()
+
     except requests.exceptions.Timeout:
         return None, "timeout", "request_timeout"
     except requests.exceptions.RequestException:
@@ -247,19 +351,67 @@ def build_output_path(input_csv_path, output_csv_path=None):
     return f"{root}_wordcount{ext}"
 
 
+def build_cache_path(input_csv_path):
+    """Keep the word count cache next to the input file."""
+    root, _ = os.path.splitext(input_csv_path)
+    return f"{root}_wordcount_cache.json"
+
+
+def load_wordcount_cache(cache_path):
+    """Load word counts found on earlier runs, keyed by URL, dropping expired entries."""
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable word count cache %s: %s", cache_path, exc)
+        return {}
+    cutoff = time.time() - WORDCOUNT_CACHE_MAX_AGE
+    return {url: entry for url, entry in cache.items() if entry.get("fetched_at", 0) >= cutoff}
+
+
+def save_wordcount_cache(cache, cache_path):
+    """Write word counts so later runs can skip refetching."""
+    if not cache_path:
+        return
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, indent=1)
+
+
 def apply_word_counts_to_csv(
     input_csv_path,
     output_csv_path=None,
     delay=2.0,
     in_place=False,
     heartbeat_every=10,
+    max_workers=8,
+    parse_workers=None,
+    cache_path=None,
 ):
-    """Read URLs from column F and write word counts to column D (note)."""
+    """Read URLs from column F and write word counts to column D (note).
+
+    URLs on different hosts are fetched in parallel by up to `max_workers`
+    threads, while each host is visited one URL at a time, each request
+    started at least `delay` seconds after the previous one; time spent
+    waiting on a slow response or parsing it counts toward that delay.
+
+    Set parse_workers > 1 to parse the downloaded pages in that many
+    processes instead of in the fetching threads, which only pays off when
+    parsing, not the network, is the bottleneck.
+
+    When `cache_path` is given, word counts found on earlier runs are read
+    from that JSON file instead of fetching the URL again, and new ones are
+    saved to it. URLs without a word count are not cached, so they are
+    retried next run.
+    """
     if not os.path.exists(input_csv_path):
         raise FileNotFoundError(f"Input CSV not found: {input_csv_path}")
 
     logger.info(f"Reading CSV: {input_csv_path}")
-    df = pd.read_csv(input_csv_path)
+    # Read every column as text: it is only written back out, so there is no
+    # point inferring dtypes, and numbers keep their original formatting
+    df = pd.read_csv(input_csv_path, dtype=str)
 
     if len(df.columns) < 6:
         raise ValueError("CSV must contain at least 6 columns so column F can be read.")
@@ -269,65 +421,111 @@ def apply_word_counts_to_csv(
     status_col = "wordcount_status"
     method_col = "wordcount_method"
 
-    df[note_col] = df[note_col].astype("object")
-    df[status_col] = "no_url"
-    df[method_col] = "not_processed"
-
     logger.info(f"Using column F for URLs: {url_col}")
     logger.info(f"Writing word counts to column D: {note_col}")
     logger.info(f"Writing processing status to column: {status_col}")
     logger.info(f"Writing extraction method to column: {method_col}")
 
     total_urls = int(df[url_col].notna().sum())
+    cache = load_wordcount_cache(cache_path) if cache_path else None
+    progress = count(1)
+    lock = threading.Lock()
     processed = 0
     success = 0
+    cached = 0
     start_time = time.perf_counter()
 
-    for index, url in df[url_col].items():
-        if pd.isna(url):
-            df.at[index, status_col] = "no_url"
-            df.at[index, method_col] = "no_url"
-            continue
+    # Blank and missing URLs are marked in one pass; only real URLs are looped over
+    url_texts = df[url_col].str.strip()
+    has_url = url_texts.notna() & (url_texts != "")
 
-        url_text = str(url).strip()
-        if not url_text:
-            df.at[index, status_col] = "no_url"
-            df.at[index, method_col] = "no_url"
-            continue
+    # Results are collected per row position and written back in one go
+    notes = df[note_col].astype("object").tolist()
+    statuses = ["no_url"] * len(df)
+    methods = has_url.map({True: "not_processed", False: "no_url"}).tolist()
 
-        processed += 1
-        logger.info(f"Processing {processed}/{total_urls}: {url_text[:90]}")
+    def record_result(position, word_count, status, method):
+        statuses[position] = status
+        methods[position] = method
 
-        word_count, status, method = get_article_word_count(url_text)
-        df.at[index, status_col] = status
-        df.at[index, method_col] = method
-
-        if status == "success" and word_count is not None:
-            existing_note = df.at[index, note_col]
+        found = status == "success" and word_count is not None
+        if found:
+            existing_note = notes[position]
             if pd.isna(existing_note) or str(existing_note).strip() == "":
-                df.at[index, note_col] = str(word_count)
+                notes[position] = str(word_count)
             else:
-                df.at[index, note_col] = f"{existing_note} | word_count: {word_count}"
-            success += 1
-
-        if heartbeat_every > 0 and processed % heartbeat_every == 0:
-            elapsed = time.perf_counter() - start_time
-            avg_per_row = elapsed / processed if processed else 0
-            remaining = max(total_urls - processed, 0)
-            eta_seconds = avg_per_row * remaining
-            progress_pct = (processed / total_urls * 100) if total_urls else 100
-            logger.info(
-                "HEARTBEAT: %d/%d (%.1f%%) complete | elapsed %.1fs | eta %.1fs | success %d",
-                processed,
-                total_urls,
-                progress_pct,
-                elapsed,
-                eta_seconds,
-                success,
-            )
+                notes[position] = f"{existing_note} | word_count: {word_count}"
+        return found
+
+    urls_by_host = defaultdict(list)
+    for position, url_text in zip(has_url.to_numpy().nonzero()[0], url_texts[has_url].tolist()):
+        entry = cache.get(url_text) if cache else None
+        if entry:
+            success += record_result(position, entry["word_count"], entry["status"], entry["method"])
+            cached += 1
+            continue
 
-        if processed < total_urls:
-            time.sleep(delay)
+        urls_by_host[urlparse(url_text).netloc].append((position, url_text))
+
+    if cached:
+        logger.info(f"Using cached word counts for {cached} URLs")
+    pending_urls = sum(len(host_urls) for host_urls in urls_by_host.values())
+
+    def process_host_urls(host_urls):
+        nonlocal processed, success
+        next_request_at = 0.0
+        for position, url_text in host_urls:
+            wait = next_request_at - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            next_request_at = time.perf_counter() + delay
+            logger.info(f"Processing {next(progress)}/{pending_urls}: {url_text[:90]}")
+
+            word_count, status, method = get_article_word_count(url_text, parse_pool)
+            found = record_result(position, word_count, status, method)
+
+            with lock:
+                success += found
+                if found and cache is not None:
+                    cache[url_text] = {
+                        "word_count": word_count,
+                        "status": status,
+                        "method": method,
+                        "fetched_at": time.time(),
+                    }
+
+                processed += 1
+                if heartbeat_every > 0 and processed % heartbeat_every == 0:
+                    elapsed = time.perf_counter() - start_time
+                    avg_per_row = elapsed / processed if processed else 0
+                    remaining = max(pending_urls - processed, 0)
+                    eta_seconds = avg_per_row * remaining
+                    progress_pct = (processed / pending_urls * 100) if pending_urls else 100
+                    logger.info(
+                        "HEARTBEAT: %d/%d (%.1f%%) complete | elapsed %.1fs | eta %.1fs | success %d",
+                        processed,
+                        pending_urls,
+                        progress_pct,
+                        elapsed,
+                        eta_seconds,
+                        success,
+                    )
+
+    parse_pool = None
+    if parse_workers and parse_workers > 1:
+        parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(process_host_urls, urls_by_host.values()))
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+        if processed:
+            save_wordcount_cache(cache, cache_path)
+
+    df[note_col] = notes
+    df[status_col] = statuses
+    df[method_col] = methods
 
     final_output = (
         input_csv_path if in_place else build_output_path(input_csv_path, output_csv_path)
@@ -338,6 +536,7 @@ def apply_word_counts_to_csv(
     logger.info("Finished processing")
     logger.info(f"Rows with URL values: {total_urls}")
     logger.info(f"Rows processed: {processed}")
+    logger.info(f"Rows filled from the cache: {cached}")
     logger.info(f"Word counts found and written to column D: {success}")
 
     return final_output
@@ -364,7 +563,30 @@ def parse_args():
         "--delay",
         type=float,
         default=2.0,
-        help="Delay in seconds between URL requests.",
+        help="Delay in seconds between URL requests to the same host.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of hosts to fetch from in parallel.",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse pages in this many processes (0 or 1 parses them in the fetching threads).",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        default=None,
+        help="Path to the word count cache. Default adds _wordcount_cache.json to the input filename.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every URL again without reading or writing the word count cache.",
     )
     parser.add_argument(
         "--in-place",
@@ -388,6 +610,9 @@ def main():
         delay=args.delay,
         in_place=args.in_place,
         heartbeat_every=args.heartbeat_every,
+        max_workers=max(1, args.workers),
+        parse_workers=args.parse_workers,
+        cache_path=None if args.no_cache else args.cache_path or build_cache_path(args.input_csv),
     )
     print(f"Updated CSV saved to: {os.path.abspath(output_path)}")
 